@@ -30,7 +30,7 @@ def _(BeamMetadata, beam_file, henry):
     beam_product = henry.new_product(
         name="Daynight Beam (DR6)",
         description="The beam for DR6 products",
-        metadata=BeamMetadata(),
+        metadata=BeamMetadata.trusted(),
         sources={"data": {"path": beam_file, "description": "Beam"}},
     )
     return (beam_product,)
@@ -119,8 +119,7 @@ def _(revision):
 def _(map_product, revision):
     second_map = "act-planck_dr4dr6_coadd_AA_daynight_f150_map.fits"
     revision.name = "ACTxPlanck DR6 f150 coadd map"
-    revision.metadata = map_product.metadata.model_copy()
-    revision.metadata.frequency = "150"
+    revision.metadata = map_product.metadata.model_copy(update={"frequency": "150"})
     revision["map"] = second_map
     revision["map"].description = "actxplanck coadd"
     return
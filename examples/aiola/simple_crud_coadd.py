@@ -28,7 +28,7 @@ from astropy.io import fits
 # sub-sections of the API. Here, we're going to be interacting with three main concepts:
 #
 # 1. Collections: A collection is a group of products that are related in some way. For
-#    our case here, the colleciton is the DR4/S13 150 GHz data.
+#    our case here, the collection is the DR4/S13 150 GHz data.
 # 2. Products: A product is a single piece of data. In this case, we're going to be
 #    working with the "splits" in a particular patch.
 # 3. Relationships: Products can be related to one another. In this case, we're going to
@@ -165,7 +165,7 @@ if __name__ == "__main__":
     )
 
     for sub_set in sub_sets.keys():
-        metadata = MapSet(
+        metadata = MapSet.trusted(
             pixelisation="healpix",
             telescope="ACT",
             instrument="ACTPol",
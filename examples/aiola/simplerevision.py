@@ -4,14 +4,12 @@ from henry import Henry
 
 henry = Henry()
 
-prod = henry.pull_product(sys.argv[1])
-revision = prod.create_revision(major=True)
+revision = henry.revise_product(sys.argv[1], major=True)
 revision.name = "New name"
 revision.description = "Haha"
-newmeta = revision.revision_of.metadata.model_copy()
-newmeta.pixelisation = "equirectangular"
-newmeta.patch = "D4"
-revision.metadata = newmeta
+revision.metadata = revision.revision_of.metadata.model_copy(
+    update={"pixelisation": "equirectangular", "patch": "D4"}
+)
 
 print(revision)
 
@@ -26,7 +26,7 @@ henry = Henry()
 map_set = henry.new_product(
     name="Compton-y Map (ACT DR6)",
     description="Compton-y map and mask from ACT DR6.",
-    metadata=MapSet(
+    metadata=MapSet.trusted(
         pixelisation="equirectangular",
         telescope="ACT",
         instrument="AdvACT",
@@ -52,7 +52,7 @@ map_set = henry.new_product(
 beam = henry.new_product(
     name="Compton-y Beam (ACT DR6)",
     description="Beam used for the Compton-y map for ACT DR6",
-    metadata=BeamMetadata(),
+    metadata=BeamMetadata.trusted(),
     sources=dict(
         data=LocalSource(path="ilc_beam.txt", description="Beam file"),
     ),
@@ -93,7 +93,7 @@ catalog_names = {
     "DR5_multiple-systems_v1.0.fits": "ACT DR5 SZ Cluster Catalog (Multiple Systems)",
 }
 
-mask = MapSet(
+mask = MapSet.trusted(
     pixelisation="equirectangular",
     telescope="ACT",
     instrument="ACTPol",
@@ -3,7 +3,26 @@ Henry is the high-level client for hippo. Lower-level functions are available
 in `hippoclient`.
 """
 
-from .core import Henry
-from .source import LocalSource
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .core import Henry
+    from .source import LocalSource
 
 __all__ = ["Henry", "LocalSource"]
+
+
+def __getattr__(name: str):
+    # The client stack is only imported once it is actually used, so that
+    # importing e.g. henry.exceptions stays cheap.
+    if name == "Henry":
+        from .core import Henry
+
+        return Henry
+
+    if name == "LocalSource":
+        from .source import LocalSource
+
+        return LocalSource
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,20 @@
-from itertools import chain
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable
 
 import httpx
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from rich.console import Console
 
 from henry.product import ProductInstance, RemoteProduct
 from hippoclient import collections, relationships
 from hippoclient.caching import MultiCache
-from hipposerve.api.models.relationships import ReadCollectionResponse
+from hipposerve.api.models.relationships import (
+    CreateCollectionTreeRequest,
+    ReadCollectionResponse,
+)
 
 from .exceptions import (
     CollectionIncompleteError,
@@ -28,15 +33,201 @@ class CollectionInstance(BaseModel):
         skip_preflight: bool = False,
         readers: list[str] | None = None,
         writers: list[str] | None = None,
+        max_workers: int = 4,
     ) -> str:
         raise NotImplementedError
 
     pass
 
 
+# Collections deeper than this below the one being printed are summarised,
+# which also stops the repr of a collection that contains itself.
+_REPR_MAX_DEPTH = 2
+_repr_state = threading.local()
+
+
+def _collection_repr(collection: CollectionInstance, kind: str) -> str:
+    depth = getattr(_repr_state, "depth", 0)
+
+    pieces = [
+        f"{kind}(name='{collection.name}', description='{collection.description}', "
+    ]
+
+    # Remote collections pulled with pull_children=False have not filled in
+    # their members yet; report what they will hold, as __str__ does.
+    deferred = getattr(collection, "_deferred", None)
+
+    if deferred is not None:
+        pieces.append(
+            f"<{len(deferred['product_ids'])} products, "
+            f"{len(deferred['collection_ids'])} collections not yet pulled>)"
+        )
+        return "".join(pieces)
+
+    if depth > _REPR_MAX_DEPTH:
+        pieces.append(
+            f"<{len(collection.products)} products, "
+            f"{len(collection.collections)} collections>)"
+        )
+        return "".join(pieces)
+
+    _repr_state.depth = depth + 1
+
+    try:
+        pieces.append("products=[")
+        pieces.append(", ".join([repr(x) for x in collection.products]))
+        pieces.append("], collections=[")
+        pieces.append(", ".join([repr(x) for x in collection.collections]))
+        pieces.append("])")
+    finally:
+        _repr_state.depth = depth
+
+    return "".join(pieces)
+
+
+def _split_members(
+    iterable: Iterable[CollectionInstance | ProductInstance],
+) -> tuple[list[ProductInstance], list[CollectionInstance]]:
+    """
+    Sort new members of a collection into products and collections, checking
+    all of them before any are added.
+    """
+    products = []
+    collections = []
+
+    for item in iterable:
+        if isinstance(item, ProductInstance):
+            products.append(item)
+        elif isinstance(item, CollectionInstance):
+            collections.append(item)
+        else:
+            raise TypeError(
+                f"Only collections or products may be appended to a collection, found {type(item)}"
+            )
+
+    return products, collections
+
+
+def _upload_products(
+    products: list[ProductInstance],
+    client: httpx.Client,
+    console: Console,
+    skip_preflight: bool,
+    readers: list[str] | None,
+    writers: list[str] | None,
+    max_workers: int,
+) -> dict[int, str]:
+    """
+    Upload products concurrently, each distinct object once, and return their
+    IDs keyed by the id() of the product.
+    """
+    unique = list({id(x): x for x in products}.values())
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique)))) as pool:
+        product_ids = pool.map(
+            lambda x: x._upload(
+                client=client,
+                console=console,
+                skip_preflight=skip_preflight,
+                readers=readers,
+                writers=writers,
+            ),
+            unique,
+        )
+
+        return {id(x): y for x, y in zip(unique, product_ids)}
+
+
+def _reachable_products(root: CollectionInstance) -> list[ProductInstance]:
+    """
+    Find every product in a collection tree that a push may need to upload,
+    i.e. skipping the contents of local collections that were already pushed.
+    """
+    products = []
+    seen = set()
+    stack = [root]
+
+    while stack:
+        collection = stack.pop()
+
+        if id(collection) in seen:
+            continue
+
+        seen.add(id(collection))
+
+        if isinstance(collection, LocalCollection) and collection.collection_id:
+            continue
+
+        # Unchanged remote collections only contain products that are
+        # already on the server, but their children may have changed.
+        if (
+            not isinstance(collection, RemoteCollection)
+            or collection._has_new_members()
+        ):
+            products.extend(collection.products)
+
+        stack.extend(collection.collections)
+
+    return products
+
+
+def _check_name_and_description(name: str, description: str):
+    if len(name) < 2 or not isinstance(name, str):
+        raise PreflightFailedError(
+            f"Name: {name} is not a valid name; ensure it is at least 2 characters and a valid string"
+        )
+
+    if len(description) < 2 or not isinstance(description, str):
+        raise PreflightFailedError(
+            f"Description: {description} is not a valid description; ensure it is at least 2 characters and a valid string"
+        )
+
+
+def _preflight_tree(root: CollectionInstance, check_files: bool = True):
+    """
+    Run the pre-flight checks for a collection tree, visiting every product
+    and collection that a push may upload exactly once.
+    """
+    seen = set()
+    stack = [root]
+
+    while stack:
+        item = stack.pop()
+
+        if id(item) in seen:
+            continue
+
+        seen.add(id(item))
+
+        if isinstance(item, ProductInstance):
+            item.preflight(check_files=check_files)
+            continue
+
+        if isinstance(item, LocalCollection):
+            if item.collection_id:
+                # We've already flown!
+                continue
+
+            _check_name_and_description(item.name, item.description)
+            stack.extend(item.products)
+        else:
+            # Remote collections were checked by the server when they were
+            # created, so only what changed since needs checking again.
+            if (item.name, item.description) != (
+                item.original_name,
+                item.original_description,
+            ):
+                _check_name_and_description(item.name, item.description)
+
+            if item._has_new_members():
+                stack.extend(item.products)
+
+        stack.extend(item.collections)
+
+
 class LocalCollection(CollectionInstance):
     """
-    A local coollection, created before pushing up to HIPPO. Can include
+    A local collection, created before pushing up to HIPPO. Can include
     LocalProduct instances that also haven't been pushed up, and other
     LocalCollection instances.
     """
@@ -50,21 +241,20 @@ class LocalCollection(CollectionInstance):
     writers: list[str] = []
 
     def __get_global_index(self, key: int, /) -> tuple[str, int]:
-        if key < 0:
-            return self.__get_global_index(self.__len__() + key)
-        elif key < len(self.products):
-            return "p", key
-        elif key < self.__len__():
-            return "c", key - len(self.products)
+        products = len(self.products)
+        size = products + len(self.collections)
+
+        index = key + size if key < 0 else key
+
+        if 0 <= index < products:
+            return "p", index
+        elif products <= index < size:
+            return "c", index - products
         else:
-            raise IndexError(f"Index {key} invalid for object of size {self.__len__()}")
+            raise IndexError(f"Index {key} invalid for object of size {size}")
 
     def __repr__(self):
-        return (
-            f"LocalCollection(name='{self.name}', description='{self.description}', "
-            f"products=[{', '.join([x.__repr__() for x in self.products])}], "
-            f"collections=[{', '.join([x.__repr__() for x in self.collections])}])"
-        )
+        return _collection_repr(self, "LocalCollection")
 
     def __str__(self):
         return (
@@ -83,36 +273,37 @@ class LocalCollection(CollectionInstance):
             return self.collections[index]
 
     def __iter__(self):
-        return chain(self.products, self.collections)
+        yield from self.products
+        yield from self.collections
 
     def __reversed__(self) -> Iterable[ProductInstance | CollectionInstance]:
-        return chain(self.collections.__reversed__(), self.products.__reversed__())
+        yield from reversed(self.collections)
+        yield from reversed(self.products)
 
     def __contains__(self, item: CollectionInstance | ProductInstance, /):
-        match item:
-            case CollectionInstance():
-                self.collections.__contains__(item)
-            case ProductInstance():
-                self.products.__contains__(item)
-            case _:
-                raise TypeError(
-                    f"Only collections or products are members of collections, found {type(item)}"
-                )
+        if isinstance(item, ProductInstance):
+            return item in self.products
+        elif isinstance(item, CollectionInstance):
+            return item in self.collections
+        else:
+            raise TypeError(
+                f"Only collections or products are members of collections, found {type(item)}"
+            )
 
     def append(self, value: CollectionInstance | ProductInstance, /):
-        match value:
-            case CollectionInstance():
-                self.collections.append(value)
-            case ProductInstance():
-                self.products.append(value)
-            case _:
-                raise TypeError(
-                    f"Only collections or products may be appended to a collection, found {type(value)}"
-                )
+        if isinstance(value, ProductInstance):
+            self.products.append(value)
+        elif isinstance(value, CollectionInstance):
+            self.collections.append(value)
+        else:
+            raise TypeError(
+                f"Only collections or products may be appended to a collection, found {type(value)}"
+            )
 
     def extend(self, iterable: Iterable[CollectionInstance | ProductInstance], /):
-        for a in iterable:
-            self.append(a)
+        products, collections = _split_members(iterable)
+        self.products.extend(products)
+        self.collections.extend(collections)
 
     def pop(self, key: int, /) -> CollectionInstance | ProductInstance:
         arr, index = self.__get_global_index(key)
@@ -122,41 +313,74 @@ class LocalCollection(CollectionInstance):
             return self.collections.pop(index)
 
     def remove(self, value, /):
-        match value:
-            case CollectionInstance():
-                self.collections.remove(value)
-            case ProductInstance():
-                self.products.remove(value)
-            case _:
-                raise TypeError(
-                    f"Only collections or products may be part of a collection, found {type(value)}"
-                )
+        if isinstance(value, ProductInstance):
+            self.products.remove(value)
+        elif isinstance(value, CollectionInstance):
+            self.collections.remove(value)
+        else:
+            raise TypeError(
+                f"Only collections or products may be part of a collection, found {type(value)}"
+            )
 
-    def preflight(self):
+    def preflight(self, check_files: bool = True):
         """
         Run a pre-flight check on this collection. This checks that:
 
         a) The collection has a valid name and description.
         b) Runs preflight checks for all connected products.
         c) Runs preflight checks for all connected collections.
+
+        With check_files=False, the products' source files are not checked.
         """
 
-        if self.collection_id:
-            # We've already flown!
-            return
+        _preflight_tree(self, check_files=check_files)
+
+    def freeze(
+        self,
+    ) -> tuple[tuple["LocalCollection", ...], list[tuple[int, int]]]:
+        """
+        Flatten this collection and every local collection below it that has
+        not yet been uploaded into a tuple of nodes, with children always
+        before their parents, and a list of (parent, child) index pairs.
+        Collections that appear in several places are only listed once.
+        """
 
-        for preflightable in self:
-            preflightable.preflight()
+        nodes = []
+        edges = []
+        index = {}
+        seen = set()
+        stack = [(self, False)]
+
+        while stack:
+            collection, expanded = stack.pop()
+            children = [
+                x
+                for x in collection.collections
+                if isinstance(x, LocalCollection) and not x.collection_id
+            ]
 
-        if len(self.name) < 2 or not isinstance(self.name, str):
-            raise PreflightFailedError(
-                f"Name: {self.name} is not a valid name; ensure it is at least 2 characters and a valid string"
-            )
+            if expanded:
+                index[id(collection)] = len(nodes)
 
-        if len(self.description) < 2 or not isinstance(self.description, str):
-            raise PreflightFailedError(
-                f"Description: {self.description} is not a valid description; ensure it is at least 2 characters and a valid string"
-            )
+                for child in children:
+                    if id(child) not in index:
+                        raise ValueError(
+                            f"Collection {collection.name} is its own descendant"
+                        )
+
+                    edges.append((len(nodes), index[id(child)]))
+
+                nodes.append(collection)
+                continue
+
+            if id(collection) in seen:
+                continue
+
+            seen.add(id(collection))
+            stack.append((collection, True))
+            stack.extend((x, False) for x in reversed(children))
+
+        return tuple(nodes), edges
 
     def _upload(
         self,
@@ -165,6 +389,7 @@ class LocalCollection(CollectionInstance):
         skip_preflight: bool = False,
         readers: list[str] | None = None,
         writers: list[str] | None = None,
+        max_workers: int = 4,
     ):
         if self.collection_id:
             # We've already been uploaded!
@@ -174,57 +399,182 @@ class LocalCollection(CollectionInstance):
             # This runs _all_ preflight checks - for all connected collections and products.
             self.preflight()
 
-        self.collection_id = collections.create(
+        # All new collections in the tree are created with a single request,
+        # with their members uploaded first and attached on creation.
+        tree, edges = self.freeze()
+        index = {id(x): i for i, x in enumerate(tree)}
+        child_indices = [[] for _ in tree]
+
+        for parent, child in edges:
+            child_indices[parent].append(child)
+
+        # Products are independent of each other, so every product in the
+        # tree (including those under remote children) is uploaded in one
+        # concurrent batch. Collections are then pushed one at a time, with
+        # their products already in place.
+        product_ids = _upload_products(
+            products=_reachable_products(self),
             client=client,
-            name=self.name,
-            description=self.description,
+            console=console,
+            skip_preflight=True,
             readers=readers,
             writers=writers,
-            console=console,
+            max_workers=max_workers,
         )
 
-        product_ids_to_connect = [
-            x._upload(
-                client=client,
-                console=console,
-                readers=readers,
-                writers=writers,
-                skip_preflight=True,
-            )
-            for x in self.products
-        ]
+        nodes = []
 
-        for product_id in product_ids_to_connect:
-            collections.add(
-                client=client,
-                id=self.collection_id,
-                product=product_id,
-                console=console,
-            )
+        for position, collection in enumerate(tree):
+            # Children that are not part of this tree (remote, or already
+            # uploaded) are pushed on their own and linked by ID.
+            child_collection_ids_to_connect = [
+                x._upload(
+                    client=client,
+                    console=console,
+                    skip_preflight=True,
+                    readers=readers,
+                    writers=writers,
+                    max_workers=max_workers,
+                )
+                for x in collection.collections
+                if id(x) not in index
+            ]
 
-        # Recurse!
-        child_collection_ids_to_connect = [
-            x._upload(
-                client=client,
-                console=console,
-                skip_preflight=True,
-                readers=readers,
-                writers=writers,
+            nodes.append(
+                CreateCollectionTreeRequest(
+                    name=collection.name,
+                    description=collection.description,
+                    readers=readers or [],
+                    writers=writers or [],
+                    products=[product_ids[id(x)] for x in collection.products],
+                    child_collections=child_collection_ids_to_connect,
+                    child_indices=child_indices[position],
+                )
             )
-            for x in self.collections
-        ]
 
-        for collection_id in child_collection_ids_to_connect:
-            relationships.add_child_collection(
-                client=client,
-                parent=self.collection_id,
-                child=collection_id,
-                console=console,
-            )
+        collection_ids = collections.create_tree(
+            client=client, collections=nodes, console=console
+        )
+
+        for collection, collection_id in zip(tree, collection_ids):
+            collection.collection_id = collection_id
 
         return self.collection_id
 
 
+# Cached collections are refreshed in the background by a few shared threads,
+# so that reading a large tree from the cache does not open a connection per
+# collection. A collection that is already waiting to be refreshed is not
+# queued again, and beyond _MAX_PENDING_REFRESHES they are left for a later
+# read, as queued refreshes still run before the interpreter exits.
+_MAX_PENDING_REFRESHES = 64
+_refresh_executor = ThreadPoolExecutor(max_workers=4)
+_refresh_pending: set[str] = set()
+_refresh_lock = threading.Lock()
+
+
+def _read_collection(
+    collection_id: str,
+    client: httpx.Client,
+    cache: MultiCache,
+    console: Console,
+    max_age: float,
+) -> ReadCollectionResponse:
+    """
+    Read a collection's metadata. If max_age is positive, a cached copy that
+    is younger than max_age seconds is returned straight away and refreshed
+    in the background, and a cached copy of any age is used if the server
+    cannot be reached.
+    """
+    key = f"collection:{collection_id}"
+
+    def refresh() -> ReadCollectionResponse:
+        # A push that happens while the read is in flight clears the cached
+        # collections; what was read may predate it, so it is then not stored.
+        generation = cache.metadata_generation
+        collection = collections.read(client=client, id=collection_id, console=console)
+        cache.set_metadata(
+            key=key, value=collection.model_dump_json(), generation=generation
+        )
+        return collection
+
+    def refresh_in_background():
+        # The caller already has the cached copy; if the server can't be
+        # reached (or the collection can no longer be read), it is simply
+        # refreshed on a later read instead.
+        try:
+            refresh()
+        except Exception:
+            pass
+        finally:
+            with _refresh_lock:
+                _refresh_pending.discard(key)
+
+    if max_age <= 0:
+        return collections.read(client=client, id=collection_id, console=console)
+
+    cached = cache.get_metadata(key=key, max_age=max_age)
+
+    if cached is not None:
+        with _refresh_lock:
+            queue = (
+                key not in _refresh_pending
+                and len(_refresh_pending) < _MAX_PENDING_REFRESHES
+            )
+
+            if queue:
+                _refresh_pending.add(key)
+
+        if queue:
+            _refresh_executor.submit(refresh_in_background)
+
+        return ReadCollectionResponse.model_validate_json(cached)
+
+    try:
+        return refresh()
+    except httpx.TransportError:
+        cached = cache.get_metadata(key=key, max_age=float("inf"))
+
+        if cached is None:
+            raise
+
+        return ReadCollectionResponse.model_validate_json(cached)
+
+
+def _intern_all(strings: list[str]) -> list[str]:
+    """
+    Intern group and user names, which repeat across every collection in a
+    large tree, so that each is only held in memory once.
+    """
+    return [sys.intern(x) for x in strings]
+
+
+def _pull_product(
+    product_id: str,
+    client: httpx.Client,
+    cache: MultiCache,
+    console: Console,
+    realize_sources: bool,
+    pulled: dict[str, "RemoteCollection | RemoteProduct"],
+) -> RemoteProduct:
+    """
+    Pull a product as part of a collection tree, re-using it if it was
+    already pulled elsewhere in the same tree.
+    """
+    key = f"product:{product_id}"
+
+    if key not in pulled:
+        pulled[key] = RemoteProduct.pull(
+            product_id=product_id,
+            client=client,
+            cache=cache,
+            console=console,
+            realize_sources=realize_sources,
+        )
+
+    return pulled[key]
+
+
 class RemoteCollection(CollectionInstance):
     """
     A remote collection, created by pushing from HIPPO.
@@ -244,6 +594,10 @@ class RemoteCollection(CollectionInstance):
     original_product_ids: set[str] = Field(default_factory=set)
     original_collection_ids: set[str] = Field(default_factory=set)
 
+    # Set when pulled with pull_children=False: everything needed to pull the
+    # children the first time they are used.
+    _deferred: dict | None = PrivateAttr(default=None)
+
     @classmethod
     def pull(
         cls,
@@ -253,11 +607,10 @@ class RemoteCollection(CollectionInstance):
         console: Console,
         pull_children: bool = True,
         realize_sources: bool = True,
+        max_age: float = 0,
     ) -> "RemoteCollection":
-        collection = collections.read(client=client, id=collection_id, console=console)
-
         if realize_sources:
-            # Ensure it's cached
+            # Ensure the whole tree is cached
             collections.cache(
                 client=client,
                 multi_cache=cache,
@@ -265,86 +618,209 @@ class RemoteCollection(CollectionInstance):
                 console=console,
             )
 
+        prefetched = {}
+
+        if pull_children and max_age <= 0:
+            # Read the metadata for the whole tree in one request, rather
+            # than one per collection.
+            try:
+                prefetched = {
+                    str(x.id): x
+                    for x in collections.read_tree(
+                        client=client, id=collection_id, console=console
+                    )
+                }
+            except httpx.HTTPStatusError as e:
+                # Servers without the tree endpoint are read collection by
+                # collection instead.
+                if e.response.status_code not in (404, 405):
+                    raise
+
+        return cls._pull(
+            collection_id=collection_id,
+            client=client,
+            cache=cache,
+            console=console,
+            pull_children=pull_children,
+            realize_sources=realize_sources,
+            max_age=max_age,
+            pulled={},
+            prefetched=prefetched,
+        )
+
+    @classmethod
+    def _pull(
+        cls,
+        collection_id: str,
+        client: httpx.Client,
+        cache: MultiCache,
+        console: Console,
+        pull_children: bool,
+        realize_sources: bool,
+        max_age: float,
+        pulled: dict[str, "RemoteCollection | RemoteProduct"],
+        prefetched: dict[str, ReadCollectionResponse],
+    ) -> "RemoteCollection":
+        # Products and collections that appear in several places in the
+        # tree are only pulled once, and then shared.
+        key = f"collection:{collection_id}"
+
+        if key in pulled:
+            return pulled[key]
+
+        collection = prefetched.get(collection_id) or _read_collection(
+            collection_id=collection_id,
+            client=client,
+            cache=cache,
+            console=console,
+            max_age=max_age,
+        )
+
+        # Each ID is converted to a string once, then shared.
+        product_ids = [str(x.id) for x in collection.products]
+        collection_ids = [str(x.id) for x in collection.child_collections]
+
         if pull_children:
             products = [
-                RemoteProduct.pull(
-                    product_id=str(x.id),
+                _pull_product(
+                    product_id=x,
                     client=client,
                     cache=cache,
                     console=console,
                     realize_sources=realize_sources,
+                    pulled=pulled,
                 )
-                for x in collection.products
+                for x in product_ids
             ]
             child_collections = [
-                RemoteCollection.pull(
-                    collection_id=str(x.id),
+                RemoteCollection._pull(
+                    collection_id=x,
                     client=client,
                     cache=cache,
                     console=console,
-                    realize_sources=realize_sources,
                     pull_children=pull_children,
+                    realize_sources=realize_sources,
+                    max_age=max_age,
+                    pulled=pulled,
+                    prefetched=prefetched,
                 )
-                for x in collection.child_collections
+                for x in collection_ids
             ]
         else:
             products = []
             child_collections = []
 
-        return cls(
+        # The metadata was validated as it was read, so there's no need to
+        # validate (and copy) every member list and ID set again.
+        remote = cls.model_construct(
             collection_id=str(collection.id),
             name=collection.name,
             description=collection.description,
             products=products,
-            owner=collection.owner,
+            owner=sys.intern(collection.owner),
             collections=child_collections,
-            readers=collection.readers,
-            writers=collection.writers,
+            readers=_intern_all(collection.readers),
+            writers=_intern_all(collection.writers),
             original_name=collection.name,
             original_description=collection.description,
-            original_product_ids={str(p.id) for p in collection.products},
-            original_collection_ids={str(c.id) for c in collection.child_collections},
+            original_product_ids=set(product_ids),
+            original_collection_ids=set(collection_ids),
         )
 
+        if not pull_children:
+            remote._deferred = {
+                "client": client,
+                "cache": cache,
+                "console": console,
+                "realize_sources": realize_sources,
+                "max_age": max_age,
+                "pulled": pulled,
+                "product_ids": product_ids,
+                "collection_ids": collection_ids,
+            }
+
+        pulled[key] = remote
+
+        return remote
+
+    def _pull_children(self):
+        """
+        Pull the products and child collections of a collection that was
+        pulled with pull_children=False. Child collections are themselves
+        pulled lazily.
+        """
+        if self._deferred is None:
+            return
+
+        deferred, self._deferred = self._deferred, None
+
+        self.products = [
+            _pull_product(
+                product_id=x,
+                client=deferred["client"],
+                cache=deferred["cache"],
+                console=deferred["console"],
+                realize_sources=deferred["realize_sources"],
+                pulled=deferred["pulled"],
+            )
+            for x in deferred["product_ids"]
+        ] + self.products
+        self.collections = [
+            RemoteCollection._pull(
+                collection_id=x,
+                client=deferred["client"],
+                cache=deferred["cache"],
+                console=deferred["console"],
+                pull_children=False,
+                realize_sources=deferred["realize_sources"],
+                max_age=deferred["max_age"],
+                pulled=deferred["pulled"],
+                prefetched={},
+            )
+            for x in deferred["collection_ids"]
+        ] + self.collections
+
     @classmethod
-    def read(cls, directory: Path | str, allow_incomplete: bool) -> "RemoteCollection":
+    def read(
+        cls, directory: Path | str, allow_incomplete: bool, max_workers: int = 4
+    ) -> "RemoteCollection":
         """
         Read a collection that was serialized to disk, usually with the
         `henry collection download $ID` command.
         """
-        directory = Path(directory)
+        # Products from the whole tree are read in a shared pool, while the
+        # (much smaller) collection files are walked in this thread.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return cls._read(Path(directory), allow_incomplete, executor)
 
-        with open(directory / "collection.json", "r") as handle:
+    @classmethod
+    def _read(
+        cls, directory: Path, allow_incomplete: bool, executor: ThreadPoolExecutor
+    ) -> "RemoteCollection":
+        with open(directory / "collection.json", "rb") as handle:
             core_metadata = ReadCollectionResponse.model_validate_json(handle.read())
 
-        products = []
-
-        for product in core_metadata.products:
-            try:
-                products.append(
-                    RemoteProduct.read(
-                        directory / product.name, allow_incomplete=allow_incomplete
-                    )
-                )
-            except FileNotFoundError:
-                if not allow_incomplete:
-                    raise CollectionIncompleteError(
-                        f"Product {product.name} not found, consider re-downloading "
-                        "or setting allow_incomplete=True"
-                    )
-            except ProductIncompleteError as e:
-                if not allow_incomplete:
-                    raise CollectionIncompleteError(
-                        f"Collection not complete due to error reading {product.name}: {e}"
-                    )
+        futures = [
+            (
+                product.name,
+                executor.submit(
+                    RemoteProduct.read,
+                    directory / product.name,
+                    allow_incomplete=allow_incomplete,
+                ),
+            )
+            for product in core_metadata.products
+        ]
 
         collections = []
 
         for collection in core_metadata.child_collections:
             try:
                 collections.append(
-                    RemoteCollection.read(
-                        directory / collection.name, allow_incomplete=allow_incomplete
+                    RemoteCollection._read(
+                        directory / collection.name,
+                        allow_incomplete=allow_incomplete,
+                        executor=executor,
                     )
                 )
             except FileNotFoundError:
@@ -357,15 +833,33 @@ class RemoteCollection(CollectionInstance):
                 if not allow_incomplete:
                     raise e
 
-        return cls(
+        products = []
+
+        for name, future in futures:
+            try:
+                products.append(future.result())
+            except FileNotFoundError:
+                if not allow_incomplete:
+                    raise CollectionIncompleteError(
+                        f"Product {name} not found, consider re-downloading "
+                        "or setting allow_incomplete=True"
+                    )
+            except ProductIncompleteError as e:
+                if not allow_incomplete:
+                    raise CollectionIncompleteError(
+                        f"Collection not complete due to error reading {name}: {e}"
+                    )
+
+        # As in pull, the metadata was already validated as it was read.
+        return cls.model_construct(
             collection_id=str(core_metadata.id),
             name=core_metadata.name,
             description=core_metadata.description,
             products=products,
-            owner=core_metadata.owner,
+            owner=sys.intern(core_metadata.owner),
             collections=collections,
-            readers=core_metadata.readers,
-            writers=core_metadata.writers,
+            readers=_intern_all(core_metadata.readers),
+            writers=_intern_all(core_metadata.writers),
             original_name=core_metadata.name,
             original_description=core_metadata.description,
             original_product_ids={str(p.id) for p in core_metadata.products},
@@ -375,32 +869,39 @@ class RemoteCollection(CollectionInstance):
         )
 
     def __get_global_index(self, key: int, /) -> tuple[str, int]:
-        if key < 0:
-            return self.__get_global_index(self.__len__() + key)
-        elif key < len(self.products):
-            return "p", key
-        elif key < self.__len__():
-            return "c", key - len(self.products)
+        products = len(self.products)
+        size = products + len(self.collections)
+
+        index = key + size if key < 0 else key
+
+        if 0 <= index < products:
+            return "p", index
+        elif products <= index < size:
+            return "c", index - products
         else:
-            raise IndexError(f"Index {key} invalid for object of size {self.__len__()}")
+            raise IndexError(f"Index {key} invalid for object of size {size}")
 
     def __repr__(self):
-        return (
-            f"RemoteCollection(name='{self.name}', description='{self.description}', "
-            f"products=[{', '.join([x.__repr__() for x in self.products])}], "
-            f"collections=[{', '.join([x.__repr__() for x in self.collections])}])"
-        )
+        return _collection_repr(self, "RemoteCollection")
 
     def __str__(self):
+        if self._deferred is None:
+            products, collections = self.products, self.collections
+        else:
+            products = self._deferred["product_ids"]
+            collections = self._deferred["collection_ids"]
+
         return (
-            f"{self.name} ({self.description}) collection with {len(self.products)} "
-            f"products and {len(self.collections)} child collections"
+            f"{self.name} ({self.description}) collection with {len(products)} "
+            f"products and {len(collections)} child collections"
         )
 
     def __len__(self) -> int:
+        self._pull_children()
         return len(self.products) + len(self.collections)
 
     def __getitem__(self, key: int, /) -> CollectionInstance | ProductInstance:
+        self._pull_children()
         arr, index = self.__get_global_index(key)
         if arr == "p":
             return self.products[index]
@@ -408,36 +909,42 @@ class RemoteCollection(CollectionInstance):
             return self.collections[index]
 
     def __iter__(self):
-        return chain(self.products, self.collections)
+        self._pull_children()
+        yield from self.products
+        yield from self.collections
 
     def __reversed__(self) -> Iterable[ProductInstance | CollectionInstance]:
-        return chain(self.collections.__reversed__(), self.products.__reversed__())
+        self._pull_children()
+        yield from reversed(self.collections)
+        yield from reversed(self.products)
 
     def __contains__(self, item: CollectionInstance | ProductInstance, /):
-        match item:
-            case CollectionInstance():
-                self.collections.__contains__(item)
-            case ProductInstance():
-                self.products.__contains__(item)
-            case _:
-                raise TypeError(
-                    f"Only collections or products are members of collections, found {type(item)}"
-                )
+        self._pull_children()
+        if isinstance(item, ProductInstance):
+            return item in self.products
+        elif isinstance(item, CollectionInstance):
+            return item in self.collections
+        else:
+            raise TypeError(
+                f"Only collections or products are members of collections, found {type(item)}"
+            )
 
     def append(self, value: CollectionInstance | ProductInstance, /):
-        match value:
-            case CollectionInstance():
-                self.collections.append(value)
-            case ProductInstance():
-                self.products.append(value)
-            case _:
-                raise TypeError(
-                    f"Only collections or products may be appended to a collection, found {type(value)}"
-                )
+        self._pull_children()
+        if isinstance(value, ProductInstance):
+            self.products.append(value)
+        elif isinstance(value, CollectionInstance):
+            self.collections.append(value)
+        else:
+            raise TypeError(
+                f"Only collections or products may be appended to a collection, found {type(value)}"
+            )
 
     def extend(self, iterable: Iterable[CollectionInstance | ProductInstance], /):
-        for a in iterable:
-            self.append(a)
+        self._pull_children()
+        products, collections = _split_members(iterable)
+        self.products.extend(products)
+        self.collections.extend(collections)
 
     def pop(self, key: int, /):
         raise RuntimeError(
@@ -451,31 +958,13 @@ class RemoteCollection(CollectionInstance):
             "list, create a LocalCollection with what you need instead"
         )
 
-    def preflight(self):
+    def preflight(self, check_files: bool = True):
         """
-        Run a pre-flight check on this collection. This checks that:
-
-        a) The collection has a valid name and description.
-        b) Runs preflight checks for all connected products.
-        c) Runs preflight checks for all connected collections.
+        Run a pre-flight check on this collection. This runs preflight checks
+        for all newly added products, and for all connected collections.
         """
 
-        if self.collection_id:
-            # We've already flown!
-            return
-
-        for preflightable in self:
-            preflightable.preflight()
-
-        if len(self.name) < 2 or not isinstance(self.name, str):
-            raise PreflightFailedError(
-                f"Name: {self.name} is not a valid name; ensure it is at least 2 characters and a valid string"
-            )
-
-        if len(self.description) < 2 or not isinstance(self.description, str):
-            raise PreflightFailedError(
-                f"Description: {self.description} is not a valid description; ensure it is at least 2 characters and a valid string"
-            )
+        _preflight_tree(self, check_files=check_files)
 
     def _upload(
         self,
@@ -484,6 +973,7 @@ class RemoteCollection(CollectionInstance):
         skip_preflight: bool = False,
         readers: list[str] | None = None,
         writers: list[str] | None = None,
+        max_workers: int = 4,
     ):
         # Cannot do the usual skip as there's no 'revision' system for
         # collections. So we must check first whether any of our children
@@ -495,15 +985,80 @@ class RemoteCollection(CollectionInstance):
             # This runs _all_ preflight checks - for all connected collections and products.
             self.preflight()
 
-        for product in self.products:
-            product._upload(
-                client=client,
-                console=console,
-                skip_preflight=skip_preflight,
-                readers=readers,
-                writers=writers,
+        # Upload the products of the whole tree in one batch, so that each
+        # collection only needs to link its own.
+        _upload_products(
+            products=_reachable_products(self),
+            client=client,
+            console=console,
+            skip_preflight=True,
+            readers=readers,
+            writers=writers,
+            max_workers=max_workers,
+        )
+
+        # Walk the remote collections in the tree without recursing, creating
+        # any local collections (each along with everything below it) as we
+        # meet them. Only then are new members linked, as that needs their IDs.
+        changed = []
+        seen = set()
+        stack = [self]
+
+        while stack:
+            collection = stack.pop()
+
+            if id(collection) in seen:
+                continue
+
+            seen.add(id(collection))
+
+            if isinstance(collection, RemoteCollection):
+                if collection._has_new_members():
+                    changed.append(collection)
+
+                stack.extend(collection.collections)
+            else:
+                collection._upload(
+                    client=client,
+                    console=console,
+                    skip_preflight=True,
+                    readers=readers,
+                    writers=writers,
+                    max_workers=max_workers,
+                )
+
+        # Linking only touches each collection's own members, so collections
+        # can be linked at the same time.
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            list(
+                executor.map(
+                    lambda x: x._link_new_members(client=client, console=console),
+                    changed,
+                )
             )
 
+        return self.collection_id
+
+    def _has_new_members(self) -> bool:
+        """
+        Whether products or child collections were added to this collection
+        since it was pulled or last pushed, however they were added: anything
+        not yet uploaded, or not among the members the server knows about.
+        """
+        return any(
+            not p.product_id or p.product_id not in self.original_product_ids
+            for p in self.products
+        ) or any(
+            not c.collection_id or c.collection_id not in self.original_collection_ids
+            for c in self.collections
+        )
+
+    def _link_new_members(self, client: httpx.Client, console: Console):
+        """
+        Link the products and child collections that were appended to this
+        collection (and have since been uploaded) to it on the server.
+        """
+
         product_ids_to_connect = [
             p.product_id
             for p in self.products
@@ -511,24 +1066,15 @@ class RemoteCollection(CollectionInstance):
             and p.product_id is not None
         ]
 
-        for product_id in product_ids_to_connect:
-            collections.add(
+        if product_ids_to_connect:
+            collections.add_many(
                 client=client,
                 id=self.collection_id,
-                product=product_id,
+                products=product_ids_to_connect,
                 console=console,
             )
+            self.original_product_ids.update(product_ids_to_connect)
 
-        for collection in self.collections:
-            collection._upload(
-                client=client,
-                console=console,
-                skip_preflight=skip_preflight,
-                readers=readers,
-                writers=writers,
-            )
-
-        # Recurse!
         child_collection_ids_to_connect = [
             c.collection_id
             for c in self.collections
@@ -536,12 +1082,11 @@ class RemoteCollection(CollectionInstance):
             and c.collection_id is not None
         ]
 
-        for collection_id in child_collection_ids_to_connect:
-            relationships.add_child_collection(
+        if child_collection_ids_to_connect:
+            relationships.add_child_collections(
                 client=client,
                 parent=self.collection_id,
-                child=collection_id,
+                children=child_collection_ids_to_connect,
                 console=console,
             )
-
-        return self.collection_id
+            self.original_collection_ids.update(child_collection_ids_to_connect)
@@ -1,3 +1,6 @@
+import asyncio
+import threading
+from functools import lru_cache
 from pathlib import Path
 
 from httpx import Client
@@ -5,7 +8,6 @@ from rich.console import Console
 
 from henry.source import LocalSource
 from hippoclient.caching import MultiCache
-from hippoclient.core import Client as AuthenticatedClient
 from hippoclient.core import ClientSettings
 from hippoclient.product import download as download_product
 from hippometa import ALL_METADATA_TYPE
@@ -13,6 +15,57 @@ from hippometa import ALL_METADATA_TYPE
 from .collection import CollectionInstance, LocalCollection, RemoteCollection
 from .product import LocalProduct, ProductInstance, RemoteProduct, RevisionProduct
 
+# Clients are shared between every Henry in the process that has the same
+# connection settings, so that creating many of them does not re-load the
+# credentials and open new connection pools each time. Each entry holds the
+# client and the number of Henry objects still using it.
+_clients: dict[tuple, list] = {}
+_clients_lock = threading.Lock()
+
+
+def _client_key(settings: ClientSettings) -> tuple:
+    return (
+        settings.host,
+        settings.token_tag,
+        settings.client_timeout,
+        settings.http2,
+        settings.max_connections,
+    )
+
+
+def _acquire_client(settings: ClientSettings) -> Client:
+    key = _client_key(settings)
+
+    with _clients_lock:
+        entry = _clients.get(key)
+
+        if entry is None or entry[0].is_closed:
+            entry = _clients[key] = [settings.client, 0]
+
+        entry[1] += 1
+
+        return entry[0]
+
+
+def _release_client(client: Client):
+    with _clients_lock:
+        for key, entry in _clients.items():
+            if entry[0] is client:
+                entry[1] -= 1
+
+                if entry[1] > 0:
+                    return
+
+                del _clients[key]
+                break
+
+    client.close()
+
+
+@lru_cache(maxsize=2)
+def _default_console(quiet: bool) -> Console:
+    return Console(quiet=quiet)
+
 
 class Henry:
     settings: ClientSettings
@@ -21,6 +74,8 @@ class Henry:
     cache: MultiCache
     slugify: bool
 
+    _product_cache: dict[str, RemoteProduct]
+
     def __init__(
         self,
         *,
@@ -29,17 +84,38 @@ class Henry:
         slugify: bool = False,
     ):
         self.settings = settings or ClientSettings()
-        self.console = console or Console(quiet=(not self.settings.verbose))
-        self.client = AuthenticatedClient(
-            host=self.settings.host, token_tag=self.settings.token_tag
-        )
+        self.console = console or _default_console(quiet=not self.settings.verbose)
+        self.client = _acquire_client(self.settings)
         self.cache = self.settings.cache
         self.readers = self.settings.default_readers
         self.writers = self.settings.default_writers
         self.slugify = slugify
 
+        self._product_cache = {}
+        self._closed = False
+
         return
 
+    def __enter__(self) -> "Henry":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """
+        Release the connections to the server. Henry objects with the same
+        connection settings share one client, which is closed once the last
+        of them is closed. Henry can also be used as a context manager, which
+        closes it on exit. Long-running services should prefer re-using a
+        single Henry.
+        """
+        if self._closed:
+            return
+
+        self._closed = True
+        _release_client(self.client)
+
     def new_product(
         self,
         name: str,
@@ -69,7 +145,34 @@ class Henry:
         self,
         item: LocalProduct | LocalCollection | RevisionProduct | RemoteCollection,
         skip_preflight: bool = False,
+        check_files: bool = True,
     ) -> str:
+        """
+        Push an item to HIPPO. The pre-flight checks can be skipped entirely
+        with skip_preflight=True, or, for bulk ingests of many files that are
+        known to exist, just the checks on the source files with
+        check_files=False.
+        """
+        # Pushing may create new versions or change the membership of
+        # anything we have seen so far, so start afresh. Products' cached
+        # source records stay, as a product ID always refers to the same files.
+        self._product_cache.clear()
+        self.cache.clear_metadata(prefix="collection:")
+
+        if not (skip_preflight or check_files):
+            item.preflight(check_files=False)
+            skip_preflight = True
+
+        if isinstance(item, CollectionInstance):
+            return item._upload(
+                client=self.client,
+                console=self.console,
+                skip_preflight=skip_preflight,
+                readers=self.readers,
+                writers=self.writers,
+                max_workers=self.settings.upload_workers,
+            )
+
         return item._upload(
             client=self.client,
             console=self.console,
@@ -78,16 +181,64 @@ class Henry:
             writers=self.writers,
         )
 
+    async def apush(
+        self,
+        item: LocalProduct | LocalCollection | RevisionProduct | RemoteCollection,
+        skip_preflight: bool = False,
+        check_files: bool = True,
+    ) -> str:
+        """
+        Push an item from async code. The upload runs in a worker thread on
+        the shared client, so independent pushes can overlap, e.g. with
+        `await asyncio.gather(henry.apush(a), henry.apush(b))`.
+        """
+        return await asyncio.to_thread(self.push, item, skip_preflight, check_files)
+
     def pull_product(
-        self, product_id: str, realize_sources: bool = True
+        self, product_id: str, realize_sources: bool = True, refresh: bool = False
     ) -> RemoteProduct:
-        return RemoteProduct.pull(
-            product_id=product_id,
-            client=self.client,
-            cache=self.cache,
-            console=self.console,
-            realize_sources=realize_sources,
-        )
+        """
+        Pull a product from HIPPO. Metadata-only pulls (realize_sources=False)
+        are cached for the lifetime of this object, and until the next push;
+        pass refresh=True to force a new request. Each call returns its own
+        copy, so changes made to one do not show up in later pulls.
+        """
+        if realize_sources:
+            return RemoteProduct.pull(
+                product_id=product_id,
+                client=self.client,
+                cache=self.cache,
+                console=self.console,
+                realize_sources=realize_sources,
+            )
+
+        if refresh or product_id not in self._product_cache:
+            self._product_cache[product_id] = RemoteProduct.pull(
+                product_id=product_id,
+                client=self.client,
+                cache=self.cache,
+                console=self.console,
+                realize_sources=False,
+            )
+
+        return self._product_cache[product_id].model_copy(deep=True)
+
+    def revise_product(
+        self,
+        product_id: str,
+        *,
+        major: bool = False,
+        minor: bool = False,
+        patch: bool = False,
+    ) -> RevisionProduct:
+        """
+        Create a revision of a remote product. Revisions only need the product's
+        metadata, so its sources are not downloaded, and a product already
+        pulled by this object is not requested again.
+        """
+        return self.pull_product(
+            product_id=product_id, realize_sources=False
+        ).create_revision(major=major, minor=minor, patch=patch)
 
     def read_product(
         self, directory: str | Path, allow_incomplete: bool = True
@@ -102,6 +253,14 @@ class Henry:
         realize_sources: bool = True,
         pull_children: bool = True,
     ) -> RemoteCollection:
+        """
+        Pull a collection from HIPPO. With pull_children=False, its products
+        and child collections are only pulled the first time the collection
+        is iterated over, indexed, or appended to; until then, its public
+        products and collections lists (and so model_dump()) are empty.
+        Collection metadata may be served from the cache, see
+        ClientSettings.metadata_max_age.
+        """
         return RemoteCollection.pull(
             collection_id=collection_id,
             client=self.client,
@@ -109,6 +268,7 @@ class Henry:
             console=self.console,
             pull_children=pull_children,
             realize_sources=realize_sources,
+            max_age=self.settings.metadata_max_age,
         )
 
     def read_collection(
@@ -1,67 +1,95 @@
 # from abc import ABC, abstractmethod
+from collections.abc import Mapping, MutableMapping
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import httpx
 from pydantic import BaseModel, Field
-from rich.console import Console
 
 from henry.source import LocalSource, RemoteSource
-from hippoclient import product as product_client
-from hippoclient.caching import MultiCache
-from hippoclient.product import ProductMetadata
 from hippometa import ALL_METADATA_TYPE
 
 from .exceptions import InvalidSlugError, PreflightFailedError, ProductIncompleteError
 
+if TYPE_CHECKING:
+    import httpx
+    from rich.console import Console
 
-class ProductInstance(BaseModel):
-    product_id: str | None
+    from hippoclient.caching import MultiCache
 
-    pass
+# The client layer (hippoclient.product, which loads the server's models) is
+# imported in the methods that talk to the server, so that products can be
+# built and checked without paying for it.
 
-    def _upload(
-        self,
-        client: httpx.Client,
-        console: Console,
-        skip_preflight: bool = False,
-        readers: list[str] | None = None,
-        writers: list[str] | None = None,
-    ) -> str:
-        raise NotImplementedError(
-            "ProductInstance is a base class, and this method must be implemented"
-        )
+# Sentinel for missing sources, so that lookups of absent slugs go straight to
+# the InvalidSlugError instead of through a KeyError.
+_MISSING = object()
 
 
-class LocalProduct(ProductInstance):
+def _invalid_text(value) -> bool:
+    # The type check has to come first; len() on a non-string would raise
+    # a TypeError rather than failing the preflight.
+    return not isinstance(value, str) or len(value) < 2
+
+
+def _source_errors(
+    sources: dict[str, LocalSource], metadata, check_files: bool = True
+) -> list[str]:
     """
-    A local product, created before pushing up to HIPPO. This includes references
-    to local files that are not yet ingested into the HIPPO system.
+    Collect every problem with a set of sources, so that they can all be
+    reported in a single PreflightFailedError. With check_files=False, the
+    source paths are not looked at.
     """
+    errors = []
+    valid_slugs = metadata.valid_slugs
+    metadata_type = type(metadata).__name__
+
+    for slug, source in sources.items():
+        if slug not in valid_slugs:
+            errors.append(
+                f"Slug {slug} not valid for upload for metadata type {metadata_type}"
+            )
+        if _invalid_text(source.description):
+            errors.append(
+                f"Description for source {slug} is not valid; ensure it is at least 2 characters and a valid string"
+            )
+        if _invalid_text(source.name):
+            errors.append(
+                f"Name for source {slug} is not valid; ensure it is at least 2 characters and a valid string"
+            )
+        # A single stat, which also catches directories that would
+        # otherwise only fail once the upload has started.
+        if check_files and not source.path.is_file():
+            errors.append(
+                f"Source {slug} has non-existent source file at {source.path}"
+            )
 
-    product_id: str | None = None
-    name: str
-    description: str
-    metadata: ALL_METADATA_TYPE
-    sources: dict[str, LocalSource] = {}
-    readers: list[str] = []
-    writers: list[str] = []
+    return errors
 
-    def model_post_init(self, __context):
-        for k, v in self.sources.items():
-            v.slug = k
-            self[k] = v
 
-        return super().model_post_init(__context)
+class _SourcesMapping:
+    """
+    The mapping protocol shared by all products, from slugs to their sources.
+    These forward straight to the sources dict, which is several times faster
+    than the generic collections.abc versions.
+    """
+
+    __slots__ = ()
+
+    def _slug_metadata(self):
+        """
+        The metadata that decides which slugs are valid.
+        """
+        return self.metadata
 
-    def __handle_key_error(self, key: str):
-        if key in self.metadata.valid_slugs:
+    def _handle_key_error(self, key: str):
+        valid_slugs = self._slug_metadata().valid_slugs
+
+        if key in valid_slugs:
             raise InvalidSlugError(
                 f"Slug {key} is valid for this metadata type, but not present in this object"
             )
         else:
-            raise InvalidSlugError(
-                f"Slug {key} not in valid list: {self.metadata.valid_slugs}"
-            )
+            raise InvalidSlugError(f"Slug {key} not in valid list: {valid_slugs}")
 
     def keys(self):
         return self.sources.keys()
@@ -75,98 +103,156 @@ class LocalProduct(ProductInstance):
     def get(self, key, default=None, /):
         return self.sources.get(key, default)
 
+    def __len__(self) -> int:
+        return self.sources.__len__()
+
+    def __getitem__(self, key):
+        if (source := self.sources.get(key, _MISSING)) is _MISSING:
+            self._handle_key_error(key=key)
+
+        return source
+
+    def __missing__(self, key):
+        self._handle_key_error(key=key)
+
+    def __iter__(self):
+        return self.sources.__iter__()
+
+    def __reversed__(self):
+        return self.sources.__reversed__()
+
+    def __contains__(self, key):
+        return self.sources.__contains__(key)
+
+
+class _MutableSourcesMapping(_SourcesMapping):
+    """
+    The mapping protocol for products that can have their (local) sources
+    changed.
+    """
+
+    __slots__ = ()
+
     def clear(self):
         return self.sources.clear()
 
     def setdefault(self, key, default=None, /):
-        if key not in self.metadata.valid_slugs:
-            self.__handle_key_error(key=key)
+        if key not in self._slug_metadata().valid_slugs:
+            self._handle_key_error(key=key)
 
         return self.sources.setdefault(key, default)
 
     def pop(self, key):
-        try:
-            return self.sources.pop(key)
-        except KeyError:
-            self.__handle_key_error(key=key)
+        if (source := self.sources.pop(key, _MISSING)) is _MISSING:
+            self._handle_key_error(key=key)
+
+        return source
 
     def popitem(self):
-        try:
-            return self.sources.popitem()
-        except KeyError:
+        if not self.sources:
             raise InvalidSlugError("No slugs left to pop (gross!)")
 
-    def copy(self):
-        new = LocalProduct(
-            name=self.name, description=self.description, metadata=self.metadata
-        )
-
-        new.sources = self.sources.copy()
-
-        return new
-
-    def __len__(self) -> int:
-        return self.sources.__len__()
-
-    def __getitem__(self, key):
-        try:
-            return self.sources.__getitem__(key)
-        except KeyError:
-            self.__handle_key_error(key=key)
+        return self.sources.popitem()
 
     def __setitem__(self, key, value):
-        if key not in self.metadata.valid_slugs:
-            self.__handle_key_error(key=key)
-
-        if isinstance(value, LocalSource):
-            self.sources.__setitem__(key, value)
-        elif isinstance(value, (str, Path)):
-            self.sources.__setitem__(
-                key, LocalSource(path=Path(value), slug=key, description=None)
-            )
+        if key not in self._slug_metadata().valid_slugs:
+            self._handle_key_error(key=key)
+
+        # Exact type checks first, as callers almost always pass exactly one
+        # of these; subclasses still fall through to isinstance.
+        kind = type(value)
+
+        if kind is LocalSource or isinstance(value, LocalSource):
+            value.slug = key
+            self.sources[key] = value
+        elif kind is str or isinstance(value, (str, Path)):
+            # LocalSource converts strings to paths itself.
+            self.sources[key] = LocalSource(path=value, slug=key, description=None)
         else:
             raise TypeError(
                 f"Value for key '{key}' must be a LocalSource, str, or Path, not {type(value).__name__}"
             )
 
     def __delitem__(self, key):
-        try:
-            self.sources.__delitem__(key)
-        except KeyError:
-            self.__handle_key_error(key=key)
+        if self.sources.pop(key, _MISSING) is _MISSING:
+            self._handle_key_error(key=key)
 
-    def __missing__(self, key):
-        self.__handle_key_error(key=key)
 
-    def __iter__(self):
-        return self.sources.__iter__()
+class ProductInstance(BaseModel):
+    product_id: str | None
 
-    def __reversed__(self):
-        return self.sources.__reversed__()
+    pass
+
+    def _upload(
+        self,
+        client: "httpx.Client",
+        console: "Console",
+        skip_preflight: bool = False,
+        readers: list[str] | None = None,
+        writers: list[str] | None = None,
+    ) -> str:
+        raise NotImplementedError(
+            "ProductInstance is a base class, and this method must be implemented"
+        )
 
-    def __contains__(self, key):
-        return self.sources.__contains__(key)
+
+class LocalProduct(_MutableSourcesMapping, ProductInstance, MutableMapping):
+    """
+    A local product, created before pushing up to HIPPO. This includes references
+    to local files that are not yet ingested into the HIPPO system.
+    """
+
+    product_id: str | None = None
+    name: str
+    description: str
+    metadata: ALL_METADATA_TYPE
+    sources: dict[str, LocalSource] = {}
+    readers: list[str] = []
+    writers: list[str] = []
+
+    def model_post_init(self, __context):
+        # Check every slug at once, rather than re-setting each source.
+        if invalid := self.sources.keys() - self.metadata.valid_slugs:
+            self._handle_key_error(key=min(invalid))
+
+        for k, v in self.sources.items():
+            v.slug = k
+
+        return super().model_post_init(__context)
+
+    def copy(self):
+        # Everything here has already been validated.
+        return LocalProduct.model_construct(
+            name=self.name,
+            description=self.description,
+            metadata=self.metadata,
+            sources=self.sources.copy(),
+            readers=self.readers.copy(),
+            writers=self.writers.copy(),
+        )
 
     def __repr__(self):
         return (
             f"LocalProduct(name='{self.name}', description='{self.description}', "
-            f"metadata={self.metadata.__repr__()}, "
-            f"{', '.join([f'{x}={y.__repr__()}' for x, y in self.sources.items()])})"
+            f"metadata={self.metadata!r}, "
+            f"{', '.join([f'{x}={y!r}' for x, y in self.sources.items()])})"
         )
 
     def __str__(self):
         return (
-            f"{self.name} ({self.description}) -- {self.metadata.__str__()} "
-            f"-- Sources: {', '.join([x.__str__() for x in self.sources.values()])}"
+            f"{self.name} ({self.description}) -- {self.metadata} "
+            f"-- Sources: {', '.join([str(x) for x in self.sources.values()])}"
         )
 
-    def preflight(self):
+    def preflight(self, check_files: bool = True):
         """
         Run a pre-flight check on this product. This checks that:
 
         a) The product has a valid name and description.
         b) That each source has a valid slug, name, and description.
-        c) That each source's path points to an existing valid file.
+        c) That each source's path points to an existing valid file. This
+           can be skipped with check_files=False, e.g. for bulk ingests of
+           files that are known to exist.
 
         If any check fails, we raise a PreflightFailedError.
         """
@@ -175,48 +261,29 @@ class LocalProduct(ProductInstance):
             # We've already flown!
             return
 
-        if len(self.name) < 2 or not isinstance(self.name, str):
-            raise PreflightFailedError(
+        errors = []
+
+        if _invalid_text(self.name):
+            errors.append(
                 f"Name: {self.name} is not a valid name; ensure it is at least 2 characters and a valid string"
             )
 
-        if len(self.description) < 2 or not isinstance(self.description, str):
-            raise PreflightFailedError(
+        if _invalid_text(self.description):
+            errors.append(
                 f"Description: {self.description} is not a valid description; ensure it is at least 2 characters and a valid string"
             )
 
-        for slug, source in self.sources.items():
-            if slug not in self.metadata.valid_slugs:
-                raise PreflightFailedError(
-                    f"Slug {slug} not valid for upload for metadata type {type(self.metadata).__name__}"
-                )
-            if source.slug not in self.metadata.valid_slugs:
-                raise PreflightFailedError(
-                    f"Slug {source.slug} not valid for upload for metadata type {type(self.metadata).__name__}"
-                )
-            if (
-                not source.description
-                or len(source.description) < 2
-                or not isinstance(source.description, str)
-            ):
-                raise PreflightFailedError(
-                    f"Description for source {source.slug} is not valid; ensure it is at least 2 characters and a valid string"
-                )
-            if len(source.name) < 2 or not isinstance(source.name, str):
-                raise PreflightFailedError(
-                    f"Name for source {source.slug} is not valid; ensure it is at least 2 characters and a valid string"
-                )
-            if not source.path.exists():
-                raise PreflightFailedError(
-                    f"Source {source.slug} has non-existent source file at {source.path}"
-                )
+        errors += _source_errors(self.sources, self.metadata, check_files)
+
+        if errors:
+            raise PreflightFailedError("\n".join(errors))
 
         return
 
     def _upload(
         self,
-        client: httpx.Client,
-        console: Console,
+        client: "httpx.Client",
+        console: "Console",
         skip_preflight: bool = False,
         readers: list[str] | None = None,
         writers: list[str] | None = None,
@@ -228,6 +295,8 @@ class LocalProduct(ProductInstance):
         if not skip_preflight:
             self.preflight()
 
+        from hippoclient import product as product_client
+
         remote_id = product_client.create(
             client=client,
             name=self.name,
@@ -243,7 +312,7 @@ class LocalProduct(ProductInstance):
         return remote_id
 
 
-class RemoteProduct(ProductInstance):
+class RemoteProduct(_SourcesMapping, ProductInstance, Mapping):
     """
     A remote product, created by pulling down from HIPPO. This includes references
     to 'remote' files - either those in a cache or in-memory after download.
@@ -264,29 +333,23 @@ class RemoteProduct(ProductInstance):
 
         return super().model_post_init(__context)
 
-    def __handle_key_error(self, key: str):
-        if key in self.sources.valid_slugs:
-            raise InvalidSlugError(
-                f"Slug {key} is valid for this metadata type, but not present in this object"
-            )
-        else:
-            raise InvalidSlugError(
-                f"Slug {key} not in valid list: {self.metadata.valid_slugs}"
-            )
-
     @classmethod
     def pull(
         cls,
         product_id: str,
-        client: httpx.Client,
-        cache: MultiCache,
-        console: Console,
+        client: "httpx.Client",
+        cache: "MultiCache",
+        console: "Console",
         realize_sources: bool = True,
     ) -> "RemoteProduct":
+        from hippoclient import product as product_client
+
         product_metadata = product_client.read(
             client=client, id=product_id, console=console
         )
 
+        paths = {}
+
         if realize_sources:
             # Ensure it's cached
             product_client.cache(
@@ -296,15 +359,22 @@ class RemoteProduct(ProductInstance):
                 console=console,
             )
 
+            # Look up every source at once, rather than each realizing itself.
+            paths = cache.available_many(
+                [x.uuid for x in product_metadata.sources.values()]
+            )
+
         # Convert the sources
         sources = {
             x: RemoteSource(
+                path=(path := paths.get(y.uuid)),
                 slug=x,
                 name=y.name,
                 description=y.description,
                 source_id=y.uuid,
+                cached=path is not None,
                 cache=cache,
-                realize=realize_sources,
+                realize=realize_sources and path is None,
             )
             for x, y in product_metadata.sources.items()
         }
@@ -326,9 +396,11 @@ class RemoteProduct(ProductInstance):
         Read a product that was serialized to disk, usually with the
         `henry prodcut download $ID` command.
         """
+        from hippoclient.product import ProductMetadata
+
         directory = Path(directory)
 
-        with open(directory / "product.json", "r") as handle:
+        with open(directory / "product.json", "rb") as handle:
             core_metadata = ProductMetadata.model_validate_json(handle.read())
 
         sources = {}
@@ -363,59 +435,30 @@ class RemoteProduct(ProductInstance):
             writers=core_metadata.writers,
         )
 
-    def keys(self):
-        return self.sources.keys()
-
-    def values(self):
-        return self.sources.values()
-
-    def items(self):
-        return self.sources.items()
-
-    def get(self, key, default=None, /):
-        return self.sources.get(key, default)
-
     def copy(self):
-        new = RemoteProduct(
-            name=self.name, description=self.description, metadata=self.metadata
+        # Everything here has already been validated.
+        return RemoteProduct.model_construct(
+            product_id=self.product_id,
+            name=self.name,
+            description=self.description,
+            metadata=self.metadata,
+            version=self.version,
+            sources=self.sources.copy(),
+            readers=self.readers.copy(),
+            writers=self.writers.copy(),
         )
 
-        new.sources = self.sources.copy()
-
-        return new
-
-    def __len__(self) -> int:
-        return self.sources.__len__()
-
-    def __getitem__(self, key):
-        try:
-            return self.sources.__getitem__(key)
-        except KeyError:
-            self.__handle_key_error(key=key)
-
-    def __missing__(self, key):
-        self.__handle_key_error(key=key)
-
-    def __iter__(self):
-        return self.sources.__iter__()
-
-    def __reversed__(self):
-        return self.sources.__reversed__()
-
-    def __contains__(self, key):
-        return self.sources.__contains__(key)
-
     def __repr__(self):
         return (
             f"RemoteProduct(name='{self.name}', description='{self.description}', "
-            f"metadata={self.metadata.__repr__()}, "
-            f"{', '.join([f'{x}={y.__repr__()}' for x, y in self.sources.items()])})"
+            f"metadata={self.metadata!r}, "
+            f"{', '.join([f'{x}={y!r}' for x, y in self.sources.items()])})"
         )
 
     def __str__(self):
         return (
-            f"{self.name} ({self.description}) -- {self.metadata.__str__()} "
-            f"-- Sources: {', '.join([x.__str__() for x in self.sources.values()])}"
+            f"{self.name} ({self.description}) -- {self.metadata} "
+            f"-- Sources: {', '.join([str(x) for x in self.sources.values()])}"
         )
 
     def create_revision(
@@ -442,7 +485,7 @@ class RemoteProduct(ProductInstance):
             writers=self.writers,
         )
 
-    def preflight(self):
+    def preflight(self, check_files: bool = True):
         """
         Preflight pass-through; used when we are adding a collection.
         """
@@ -455,7 +498,7 @@ class RemoteProduct(ProductInstance):
         return self.product_id
 
 
-class RevisionProduct(ProductInstance):
+class RevisionProduct(_MutableSourcesMapping, ProductInstance, MutableMapping):
     """
     A revision of a product, created from a RemoteProduct. Everything starts
     out empty, then if you make changes to this we push those changes to
@@ -475,21 +518,17 @@ class RevisionProduct(ProductInstance):
     writers: list[str]
 
     def model_post_init(self, __context):
+        # Check every slug at once, rather than re-setting each source.
+        if invalid := self.sources.keys() - self.revision_of.metadata.valid_slugs:
+            self._handle_key_error(key=min(invalid))
+
         for k, v in self.sources.items():
             v.slug = k
-            self[k] = v
 
         return super().model_post_init(__context)
 
-    def __handle_key_error(self, key: str):
-        if key in self.revision_of.metadata.valid_slugs:
-            raise InvalidSlugError(
-                f"Slug {key} is valid for this metadata type, but not present in this object"
-            )
-        else:
-            raise InvalidSlugError(
-                f"Slug {key} not in valid list: {self.revision_of.metadata.valid_slugs}"
-            )
+    def _slug_metadata(self):
+        return self.revision_of.metadata
 
     def __setattr__(self, name, value):
         # Cannot change metadata type.
@@ -501,93 +540,19 @@ class RevisionProduct(ProductInstance):
                 )
         super().__setattr__(name, value)
 
-    def keys(self):
-        return self.sources.keys()
-
-    def values(self):
-        return self.sources.values()
-
-    def items(self):
-        return self.sources.items()
-
-    def get(self, key, default=None, /):
-        return self.sources.get(key, default)
-
-    def clear(self):
-        return self.sources.clear()
-
-    def setdefault(self, key, default=None, /):
-        if key not in self.revision_of.metadata.valid_slugs:
-            self.__handle_key_error(key=key)
-
-        return self.sources.setdefault(key, default)
-
-    def pop(self, key):
-        try:
-            return self.sources.pop(key)
-        except KeyError:
-            self.__handle_key_error(key=key)
-
-    def popitem(self):
-        try:
-            return self.sources.popitem()
-        except KeyError:
-            raise InvalidSlugError("No slugs left to pop (gross!)")
-
     def copy(self):
-        new = RevisionProduct(
+        # Everything here has already been validated.
+        return RevisionProduct.model_construct(
             revision_of=self.revision_of,
+            revision_level=self.revision_level,
             name=self.name,
             description=self.description,
             metadata=self.metadata,
+            sources=self.sources.copy(),
+            readers=self.readers.copy(),
+            writers=self.writers.copy(),
         )
 
-        new.sources = self.sources.copy()
-
-        return new
-
-    def __len__(self) -> int:
-        return self.sources.__len__()
-
-    def __getitem__(self, key):
-        try:
-            return self.sources.__getitem__(key)
-        except KeyError:
-            self.__handle_key_error(key=key)
-
-    def __setitem__(self, key, value):
-        if key not in self.revision_of.metadata.valid_slugs:
-            self.__handle_key_error(key=key)
-
-        if isinstance(value, LocalSource):
-            self.sources.__setitem__(key, value)
-        elif isinstance(value, (str, Path)):
-            self.sources.__setitem__(
-                key, LocalSource(path=Path(value), slug=key, description=None)
-            )
-        else:
-            raise TypeError(
-                f"Value for key '{key}' must be a LocalSource, str, or Path, not {type(value).__name__}"
-            )
-
-    def __delitem__(self, key):
-        try:
-            self.sources.__delitem__(key)
-        except KeyError:
-            self.__handle_key_error(key=key)
-
-    def __missing__(self, key):
-        self.__handle_key_error(key=key)
-
-    def __iter__(self):
-        return self.sources.__iter__()
-
-    def __reversed__(self):
-        return self.sources.__reversed__()
-
-    def __contains__(self, key):
-        return self.sources.__contains__(key)
-
     def __str__(self):
         diff = self._calculate_diff()
 
@@ -638,35 +603,40 @@ class RevisionProduct(ProductInstance):
         new_sources = {}
         replace_sources = {}
 
-        for source in self:
-            if source in self.revision_of:
-                replace_sources[source] = self[source]
+        for slug, source in self.sources.items():
+            if slug in self.revision_of:
+                replace_sources[slug] = source
             else:
-                new_sources[source] = self[source]
+                new_sources[slug] = source
 
         diff["new_sources"] = new_sources
         diff["replace_sources"] = replace_sources
 
         diff.update(
-            self._claculate_reader_writer_diff(
+            self._calculate_reader_writer_diff(
                 readers=self.readers, writers=self.writers
             )
         )
 
         return diff
 
-    def _claculate_reader_writer_diff(
+    def _calculate_reader_writer_diff(
         self, readers: list[str], writers: list[str]
     ) -> dict:
         """
         Calculates a difference in readers and writers, if they are provided
         """
 
-        add_readers = set(self.revision_of.readers) - set(readers or [])
-        add_writers = set(self.revision_of.writers) - set(writers or [])
+        old_readers = set(self.revision_of.readers)
+        old_writers = set(self.revision_of.writers)
+        new_readers = set(readers or [])
+        new_writers = set(writers or [])
 
-        remove_readers = set(readers or []) - set(self.revision_of.readers)
-        remove_writers = set(writers or []) - set(self.revision_of.writers)
+        add_readers = old_readers - new_readers
+        add_writers = old_writers - new_writers
+
+        remove_readers = new_readers - old_readers
+        remove_writers = new_writers - old_writers
 
         diff = {
             "add_readers": add_readers or None,
@@ -677,7 +647,7 @@ class RevisionProduct(ProductInstance):
 
         return diff
 
-    def preflight(self):
+    def preflight(self, check_files: bool = True):
         diff = self._calculate_diff()
 
         if self.product_id:
@@ -689,49 +659,31 @@ class RevisionProduct(ProductInstance):
                 "No changes detected in this revision; nothing to upload"
             )
 
+        errors = []
+
         if name := diff.get("name", None):
-            if len(name) < 2 or not isinstance(name, str):
-                raise PreflightFailedError(
+            if _invalid_text(name):
+                errors.append(
                     f"Name: {name} is not a valid name; ensure it is at least 2 characters and a valid string"
                 )
 
         if description := diff.get("description", None):
-            if len(description) < 2 or not isinstance(description, str):
-                raise PreflightFailedError(
+            if _invalid_text(description):
+                errors.append(
                     f"Description: {description} is not a valid description; ensure it is at least 2 characters and a valid string"
                 )
 
-        for slug, source in self.sources.items():
-            if slug not in self.revision_of.metadata.valid_slugs:
-                raise PreflightFailedError(
-                    f"Slug {slug} not valid for upload for metadata type {type(self.revision_of.metadata).__name__}"
-                )
-            if source.slug not in self.revision_of.metadata.valid_slugs:
-                raise PreflightFailedError(
-                    f"Slug {source.slug} not valid for upload for metadata type {type(self.revision_of.metadata).__name__}"
-                )
-            if (
-                not source.description
-                or len(source.description) < 2
-                or not isinstance(source.description, str)
-            ):
-                raise PreflightFailedError(
-                    f"Description for source {source.slug} is not valid; ensure it is at least 2 characters and a valid string"
-                )
-            if len(source.name) < 2 or not isinstance(source.name, str):
-                raise PreflightFailedError(
-                    f"Name for source {source.slug} is not valid; ensure it is at least 2 characters and a valid string"
-                )
-            if not source.path.exists():
-                raise PreflightFailedError(
-                    f"Source {source.slug} has non-existent source file at {source.path}"
-                )
+        errors += _source_errors(self.sources, self.revision_of.metadata, check_files)
+
+        if errors:
+            raise PreflightFailedError("\n".join(errors))
+
         return
 
     def _upload(
         self,
-        client: httpx.Client,
-        console: Console,
+        client: "httpx.Client",
+        console: "Console",
         skip_preflight: bool = False,
         readers: list[str] | None = None,
         writers: list[str] | None = None,
@@ -760,6 +712,8 @@ class RevisionProduct(ProductInstance):
             x: y.description for x, y in replace_sources.items()
         }
 
+        from hippoclient import product as product_client
+
         remote_id = product_client.update(
             client=client,
             id=self.revision_of.product_id,
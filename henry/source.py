@@ -1,28 +1,34 @@
 # from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from pathlib import Path
 
-from pydantic import BaseModel, Field
-
 from hippoclient.caching import MultiCache
 
+# Sources are plain slotted dataclasses rather than pydantic models: products
+# create one per source on every pull and read, and pydantic still validates
+# them (and keeps identity) when they are stored on a product.
+
 
-class SourceInstance(BaseModel):
+@dataclass(slots=True, kw_only=True, repr=False)
+class SourceInstance:
     path: Path
     slug: str | None = None
     name: str | None = None
     description: str | None = None
 
 
+@dataclass(slots=True, kw_only=True, repr=False)
 class LocalSource(SourceInstance):
-    def model_post_init(self, __context):
+    def __post_init__(self):
+        if not isinstance(self.path, Path):
+            self.path = Path(self.path)
+
         if self.name is None:
             self.name = self.path.stem
 
-        return super().model_post_init(__context)
-
     def __repr__(self):
         return (
-            f"LocalSource(path={self.path.__repr__()}, slug='{self.slug}',"
+            f"LocalSource(path={self.path!r}, slug='{self.slug}',"
             f"name='{self.name}', description='{self.description}')"
         )
 
@@ -30,20 +36,24 @@ class LocalSource(SourceInstance):
         return f"LocalSource {self.slug} ({self.name}; {self.description}) representing {self.path}"
 
 
+@dataclass(slots=True, kw_only=True, repr=False)
 class RemoteSource(SourceInstance):
     path: Path | None = None
 
-    source_id: str = Field(frozen=True)
+    # Identifies the stored object on the server; treat as read-only.
+    source_id: str
 
     cached: bool = False
     cache: MultiCache | None = None
 
     realize: bool = False
 
-    def model_post_init(self, __context):
+    def __post_init__(self):
+        if self.path is not None and not isinstance(self.path, Path):
+            self.path = Path(self.path)
+
         if self.realize:
             self.path = self.__realize()
-        return super().model_post_init(__context)
 
     def __realize(self) -> Path:
         if self.path is not None:
@@ -65,9 +75,9 @@ class RemoteSource(SourceInstance):
 
     def __repr__(self):
         return (
-            f"RemoteSource(path={self.path.__repr__()}, slug='{self.slug}',"
+            f"RemoteSource(path={self.path!r}, slug='{self.slug}',"
             f"name='{self.name}', description='{self.description}', cached={self.cached}, "
-            f"cache={self.cache.__repr__()}, source_id='{self.source_id}')"
+            f"cache={self.cache!r}, source_id='{self.source_id}')"
         )
 
     def __str__(self):
@@ -13,5 +13,23 @@ __all__ = [
     "caching",
 ]
 
-from . import caching, collections, product, relationships
-from .core import Client
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import caching, collections, product, relationships
+    from .core import Client
+
+
+def __getattr__(name: str):
+    # The submodules import the server's models (and so fastapi, beanie, and
+    # minio), so they are only loaded once they are actually used.
+    if name == "Client":
+        from .core import Client
+
+        return Client
+
+    if name in __all__:
+        return import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
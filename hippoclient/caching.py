@@ -6,7 +6,8 @@ A cache is:
 a) A directory on your filesystem
 b) A set of files in that directory
 c) A SQLite database that stores metadata about the files
-   that are being cached.
+   that are being cached, along with recently fetched API
+   responses (e.g. collection metadata).
 
 Because marshalling is so simple here we do not use
 SQLAlchemy or any other ORM. We just use the built-in
@@ -16,13 +17,19 @@ Python sqlite3 module.
 import os
 import shutil
 import sqlite3
+import threading
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, PrivateAttr
 from rich.console import Console
 
 from hippoclient.downloads import downloader
-from hipposerve.database import FileMetadata
+
+if TYPE_CHECKING:
+    # Only used in annotations; importing it loads the whole server stack.
+    from hipposerve.database import FileMetadata
 
 
 class CacheNotWriteableError(Exception):
@@ -90,6 +97,7 @@ class Cache(BaseModel):
 
     _database: Path = PrivateAttr()
     _connection: sqlite3.Connection = PrivateAttr()
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
 
     def model_post_init(self, __context):
         self._database = self.path / self.database_name
@@ -100,19 +108,28 @@ class Cache(BaseModel):
         Initialize the cache database.
         """
 
-        if self._database.exists():
-            return sqlite3.connect(self._database)
-        else:
-            # Create the database
-            connection = sqlite3.connect(self._database)
+        exists = self._database.exists()
 
-            cursor = connection.cursor()
+        # Metadata may be refreshed from background threads, and sources may
+        # be fetched concurrently; all access to the database goes through
+        # _lock.
+        connection = sqlite3.connect(self._database, check_same_thread=False)
+        cursor = connection.cursor()
+
+        if not exists:
             cursor.execute(
                 "CREATE TABLE sources (id PRIMARY KEY, path, checksum, size, available)"
             )
-            connection.commit()
 
-            return connection
+        # Caches created before metadata caching existed gain the table here.
+        if os.access(self._database, os.W_OK):
+            cursor.execute(
+                "CREATE TABLE IF NOT EXISTS metadata (key PRIMARY KEY, value, updated)"
+            )
+
+        connection.commit()
+
+        return connection
 
     @property
     def writeable(self) -> bool:
@@ -128,36 +145,39 @@ class Cache(BaseModel):
         be called _before_ downloading the actual source.
         """
 
-        cursor = self._connection.cursor()
-        cursor.execute(
-            "INSERT INTO sources (id, path, checksum, size, available) VALUES (?, ?, ?, ?, ?)",
-            (str(id), str(path), str(checksum), int(size), False),
-        )
-        self._connection.commit()
+        with self._lock:
+            cursor = self._connection.cursor()
+            cursor.execute(
+                "INSERT INTO sources (id, path, checksum, size, available) VALUES (?, ?, ?, ?, ?)",
+                (str(id), str(path), str(checksum), int(size), False),
+            )
+            self._connection.commit()
 
     def _mark_available(self, id: str):
         """
         Mark a source as available.
         """
 
-        cursor = self._connection.cursor()
-        cursor.execute(
-            "UPDATE sources SET available = ? WHERE id = ?",
-            (True, str(id)),
-        )
-        self._connection.commit()
+        with self._lock:
+            cursor = self._connection.cursor()
+            cursor.execute(
+                "UPDATE sources SET available = ? WHERE id = ?",
+                (True, str(id)),
+            )
+            self._connection.commit()
 
     def _mark_unavailable(self, id: str):
         """
         Mark a source as unavailable.
         """
 
-        cursor = self._connection.cursor()
-        cursor.execute(
-            "UPDATE sources SET available = ? WHERE id = ?",
-            (False, str(id)),
-        )
-        self._connection.commit()
+        with self._lock:
+            cursor = self._connection.cursor()
+            cursor.execute(
+                "UPDATE sources SET available = ? WHERE id = ?",
+                (False, str(id)),
+            )
+            self._connection.commit()
 
     def _get(self, id: str) -> Path | None:
         """
@@ -165,20 +185,46 @@ class Cache(BaseModel):
         If it is available we return the absolute path on the system to the file.
         """
 
-        cursor = self._connection.cursor()
+        with self._lock:
+            cursor = self._connection.cursor()
 
-        cursor.execute(
-            "SELECT path FROM sources WHERE id = ? AND available = ?",
-            (str(id), True),
-        )
+            cursor.execute(
+                "SELECT path FROM sources WHERE id = ? AND available = ?",
+                (str(id), True),
+            )
 
-        result = cursor.fetchone()
+            result = cursor.fetchone()
 
         if result is None:
             return None
         else:
             return self.path / Path(result[0])
 
+    def _get_many(self, ids: list[str]) -> dict[str, Path]:
+        """
+        Get all of the sources in ``ids`` that are available in the cache, as
+        a dictionary of IDs to absolute paths, with as few queries as possible.
+        """
+
+        found = {}
+
+        with self._lock:
+            cursor = self._connection.cursor()
+
+            # Stay well within SQLite's limit on the number of parameters.
+            for start in range(0, len(ids), 500):
+                chunk = [str(x) for x in ids[start : start + 500]]
+
+                cursor.execute(
+                    "SELECT id, path FROM sources WHERE available = ? AND id IN "
+                    f"({', '.join('?' * len(chunk))})",
+                    (True, *chunk),
+                )
+
+                found.update({x: self.path / Path(y) for x, y in cursor.fetchall()})
+
+        return found
+
     def _remove(self, id: str):
         """
         Remove a source from the cache.
@@ -190,15 +236,35 @@ class Cache(BaseModel):
         if path is not None:
             path.unlink()
 
-        cursor = self._connection.cursor()
-        cursor.execute(
-            "DELETE FROM sources WHERE id = ?",
-            (str(id),),
-        )
-        self._connection.commit()
+        with self._lock:
+            cursor = self._connection.cursor()
+            cursor.execute(
+                "DELETE FROM sources WHERE id = ?",
+                (str(id),),
+            )
+            self._connection.commit()
+
+    def _remove_all(self):
+        """
+        Remove every source from the cache, in a single transaction.
+        """
+
+        for path in self._get_many(self.complete_id_list).values():
+            path.unlink()
+
+        with self._lock:
+            cursor = self._connection.cursor()
+            cursor.execute("DELETE FROM sources")
+            self._connection.commit()
 
     def _fetch(
-        self, id: str, path: str, checksum: str, size: int, presigned_url: str
+        self,
+        id: str,
+        path: str,
+        checksum: str,
+        size: int,
+        presigned_url: str,
+        show_progress: bool = True,
     ) -> Path:
         """
         Fetch a source from the presigned URL we are provided, store it in
@@ -216,6 +282,8 @@ class Cache(BaseModel):
             The size of the source
         presigned_url : str
             The presigned URL to fetch the source from
+        show_progress : bool
+            Whether to show a progress bar for the download
 
         Returns
         -------
@@ -241,7 +309,7 @@ class Cache(BaseModel):
             downloader(
                 presigned_url=presigned_url,
                 output_destination=destination_path,
-                console=Console(),
+                console=Console() if show_progress else None,
             )
 
             self._mark_available(id)
@@ -261,7 +329,13 @@ class Cache(BaseModel):
         return destination_path
 
     def get(
-        self, id: str, path: str, checksum: str, size: int, presigned_url: str
+        self,
+        id: str,
+        path: str,
+        checksum: str,
+        size: int,
+        presigned_url: str,
+        show_progress: bool = True,
     ) -> Path:
         """
         Get a source from the cache. If it's not available, fetch it from the
@@ -279,6 +353,8 @@ class Cache(BaseModel):
             The size of the source
         presigned_url : str
             The presigned URL to fetch the source from, if it not in the cache.
+        show_progress : bool
+            Whether to show a progress bar if the source is downloaded
         """
 
         cached = self._get(id)
@@ -292,6 +368,7 @@ class Cache(BaseModel):
                 checksum=checksum,
                 size=size,
                 presigned_url=presigned_url,
+                show_progress=show_progress,
             )
 
     def available(self, id: str) -> Path:
@@ -322,16 +399,75 @@ class Cache(BaseModel):
 
         return path
 
+    def get_metadata(self, key: str, max_age: float) -> str | None:
+        """
+        Get a cached API response stored under ``key``, if it was stored less
+        than ``max_age`` seconds ago. Otherwise, return None.
+        """
+
+        with self._lock:
+            try:
+                cursor = self._connection.cursor()
+                cursor.execute(
+                    "SELECT value FROM metadata WHERE key = ? AND updated > ?",
+                    (key, time.time() - max_age),
+                )
+                result = cursor.fetchone()
+            except sqlite3.OperationalError:
+                # Read-only cache without a metadata table
+                return None
+
+        return None if result is None else result[0]
+
+    def set_metadata(self, key: str, value: str):
+        """
+        Store an API response under ``key``, replacing any older copy.
+
+        Raises
+        ------
+        CacheNotWriteableError
+            If the cache is not writeable
+        """
+
+        if not self.writeable:
+            raise CacheNotWriteableError
+
+        with self._lock:
+            cursor = self._connection.cursor()
+            cursor.execute(
+                "INSERT OR REPLACE INTO metadata (key, value, updated) VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+            self._connection.commit()
+
+    def clear_metadata(self, prefix: str = ""):
+        """
+        Remove all cached API responses, or only those whose keys start with
+        ``prefix``.
+        """
+
+        if not self.writeable:
+            return
+
+        with self._lock:
+            cursor = self._connection.cursor()
+            cursor.execute(
+                "DELETE FROM metadata WHERE substr(key, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
+            self._connection.commit()
+
     @property
     def complete_id_list(self) -> list[str]:
         """
         List all the IDs in the cache
         """
 
-        cursor = self._connection.cursor()
-        cursor.execute("SELECT id FROM sources")
+        with self._lock:
+            cursor = self._connection.cursor()
+            cursor.execute("SELECT id FROM sources")
 
-        return [row[0] for row in cursor.fetchall()]
+            return [row[0] for row in cursor.fetchall()]
 
 
 class MultiCache(BaseModel):
@@ -345,6 +481,27 @@ class MultiCache(BaseModel):
 
     caches: list[Cache]
 
+    # Counts calls to clear_metadata, so that responses read before a clear
+    # are not stored after it (see set_metadata).
+    _metadata_generation: int = PrivateAttr(default=0)
+    _metadata_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @property
+    def metadata_generation(self) -> int:
+        """
+        A number that changes every time cached API responses are cleared.
+        """
+
+        return self._metadata_generation
+
+    @property
+    def writeable_caches(self) -> list[Cache]:
+        """
+        The caches that can be written to, in priority order.
+        """
+
+        return [cache for cache in self.caches if cache.writeable]
+
     def available(self, id: str) -> Path:
         """
         Check if a source is available in any cache with id ``id``.
@@ -374,7 +531,44 @@ class MultiCache(BaseModel):
 
         raise FileNotFoundError
 
-    def get(self, id: str, path: str, checksum: str, size: int, presigned_url: str):
+    def available_many(self, ids: list[str]) -> dict[str, Path]:
+        """
+        Check which of the sources with ids ``ids`` are available in any
+        cache, with one query per cache rather than one per source.
+
+        Parameters
+        ----------
+        ids : list[str]
+            The IDs of the sources
+
+        Returns
+        -------
+        dict[str, Path]
+            The paths to the sources that are available, keyed by their ID.
+            Sources that are not available are left out.
+        """
+
+        found = {}
+        remaining = list(ids)
+
+        for cache in self.caches:
+            if not remaining:
+                break
+
+            found.update(cache._get_many(remaining))
+            remaining = [x for x in remaining if x not in found]
+
+        return found
+
+    def get(
+        self,
+        id: str,
+        path: str,
+        checksum: str,
+        size: int,
+        presigned_url: str,
+        show_progress: bool = True,
+    ):
         """
         Get and store an item in the cache. You should likely use this only after
         ``available`` has raised a FileNotFoundError.
@@ -391,6 +585,8 @@ class MultiCache(BaseModel):
             The size of the source
         presigned_url : str
             The presigned URL to fetch the source from, if it not in the cache.
+        show_progress : bool
+            Whether to show a progress bar if the source is downloaded
 
         Returns
         -------
@@ -411,10 +607,56 @@ class MultiCache(BaseModel):
                     checksum=checksum,
                     size=size,
                     presigned_url=presigned_url,
+                    show_progress=show_progress,
                 )
 
         raise CacheNotWriteableError
 
+    def get_metadata(self, key: str, max_age: float) -> str | None:
+        """
+        Get a cached API response stored under ``key`` in any cache, if it was
+        stored less than ``max_age`` seconds ago. Otherwise, return None.
+        """
+
+        for cache in self.caches:
+            value = cache.get_metadata(key=key, max_age=max_age)
+
+            if value is not None:
+                return value
+
+        return None
+
+    def set_metadata(self, key: str, value: str, generation: int | None = None):
+        """
+        Store an API response in the first writeable cache. Does nothing if
+        no caches are writeable, as the response can always be fetched again.
+
+        If ``generation`` (the metadata_generation from before the response
+        was read) is given and the cached responses have been cleared since,
+        the response may already be stale and is not stored.
+        """
+
+        with self._metadata_lock:
+            if generation is not None and generation != self._metadata_generation:
+                return
+
+            for cache in self.caches:
+                if cache.writeable:
+                    cache.set_metadata(key=key, value=value)
+                    return
+
+    def clear_metadata(self, prefix: str = ""):
+        """
+        Remove all cached API responses from all caches, or only those whose
+        keys start with ``prefix``.
+        """
+
+        with self._metadata_lock:
+            self._metadata_generation += 1
+
+            for cache in self.caches:
+                cache.clear_metadata(prefix=prefix)
+
     def remove(self, id: str):
         """
         Remove a source from all caches.
@@ -423,7 +665,7 @@ class MultiCache(BaseModel):
         for cache in self.caches:
             cache._remove(id)
 
-    def names_to_paths(self, file_metadata: list[FileMetadata]) -> dict[str, Path]:
+    def names_to_paths(self, file_metadata: list["FileMetadata"]) -> dict[str, Path]:
         """
         Convert a list of FileMetadata objects to a dictionary of names to paths.
         """
@@ -437,7 +679,7 @@ class MultiCache(BaseModel):
 
         return paths
 
-    def uuids_to_paths(self, file_metadata: list[FileMetadata]) -> dict[str, Path]:
+    def uuids_to_paths(self, file_metadata: list["FileMetadata"]) -> dict[str, Path]:
         """
         Convert a list of FileMetadata objects to a dictionary of UUIDs to paths.
         """
@@ -457,8 +699,7 @@ def clear_all(cache: Cache):
     Clear all the caches.
     """
 
-    for file in cache.complete_id_list:
-        cache._remove(file)
+    cache._remove_all()
 
 
 def clear_single(cache: Cache, id: str):
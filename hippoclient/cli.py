@@ -2,6 +2,7 @@
 A CLI interface to the hippo client.
 """
 
+from functools import cached_property
 from pathlib import Path
 from typing import Annotated
 
@@ -10,13 +11,36 @@ import typer
 
 import hippoclient as sc
 
-from . import helper
 from .core import ClientSettings, MultiCache
-from .textedit import edit_product
 
-CLIENT: sc.Client
-CACHE: MultiCache
-CONSOLE: rich.console.Console
+# Only what every invocation needs is imported here; the rendering helpers,
+# the editor, and the server's models (pulled in by hippoclient's
+# submodules) are loaded by the commands that use them, which keeps --help
+# and shell completion fast.
+
+
+class _Session:
+    """
+    The client, cache, and console shared by the commands of one invocation,
+    held on the typer context. Each is only built when first used, so e.g.
+    --help never creates an HTTP client.
+    """
+
+    def __init__(self):
+        self.settings = ClientSettings()
+
+    @cached_property
+    def client(self) -> sc.Client:
+        return self.settings.client
+
+    @cached_property
+    def cache(self) -> MultiCache:
+        return self.settings.cache
+
+    @cached_property
+    def console(self) -> rich.console.Console:
+        return rich.console.Console(quiet=not self.settings.verbose)
+
 
 # Meta-setup
 APP = typer.Typer()
@@ -34,401 +58,433 @@ dev_app = typer.Typer(
 APP.add_typer(dev_app, name="dev")
 
 
+@APP.callback()
+def setup(ctx: typer.Context):
+    # The developer commands run a server and never talk to one, so they
+    # don't read the client settings at all.
+    if ctx.invoked_subcommand != "dev":
+        ctx.obj = _Session()
+
+
 @product_app.command("read")
-def product_read(id: str):
+def product_read(ctx: typer.Context, id: str):
     """
     Read the information of a product by its ID. You can find the relationship
     between product names and IDs through the product search command.
     """
-    global CLIENT, CONSOLE
+    from rich.console import Group
+    from rich.pretty import Pretty
+    from rich.styled import Styled
 
-    product = sc.product.read_with_versions(client=CLIENT, id=id, console=CONSOLE)
+    from . import helper
 
-    product_extracted_version = product.versions[product.requested]
+    console = ctx.obj.console
 
-    CONSOLE.print(product_extracted_version.name, style="bold underline color(3)")
-    CONSOLE.print(
-        "\nVersions: "
-        + helper.render_version_list(
-            product.versions, product.current, product.requested
-        )
-    )
-    CONSOLE.print(
-        rich.markdown.Markdown(product_extracted_version.description.strip("\n"))
-    )
-    CONSOLE.print(product_extracted_version.metadata)
-    CONSOLE.print(helper.render_source_list(product_extracted_version.sources, CACHE))
-    CONSOLE.print("\n" + "Relationships" + "\n", style="bold color(2)")
-    CONSOLE.print(
-        "Collections: "
-        + ", ".join(str(c) for c in product_extracted_version.collections)
+    product = sc.product.read_with_versions(
+        client=ctx.obj.client, id=id, console=console
     )
+
+    product_extracted_version = product.versions[product.requested]
+
+    # Everything is rendered as one group so that it is laid out and written
+    # to the terminal in a single pass.
+    renderables = [
+        Styled(
+            console.render_str(product_extracted_version.name),
+            "bold underline color(3)",
+        ),
+        console.render_str(
+            "\nVersions: "
+            + helper.render_version_list(
+                product.versions, product.current, product.requested
+            )
+        ),
+        helper.render_description(product_extracted_version.description),
+        Pretty(product_extracted_version.metadata),
+        helper.render_source_list(product_extracted_version.sources, ctx.obj.cache),
+        Styled(console.render_str("\n" + "Relationships" + "\n"), "bold color(2)"),
+        console.render_str(
+            "Collections: "
+            + ", ".join(str(c) for c in product_extracted_version.collections)
+        ),
+    ]
     if len(product_extracted_version.parent_of) > 0:
-        CONSOLE.print("Children: " + ", ".join(product_extracted_version.parent_of))
+        renderables.append(
+            console.render_str(
+                "Children: " + ", ".join(product_extracted_version.parent_of)
+            )
+        )
     if len(product_extracted_version.child_of) > 0:
-        CONSOLE.print("Parents: " + ", ".join(product_extracted_version.child_of))
+        renderables.append(
+            console.render_str(
+                "Parents: " + ", ".join(product_extracted_version.child_of)
+            )
+        )
+
+    console.print(Group(*renderables))
 
 
 @product_app.command("delete")
-def product_delete(id: str):
+def product_delete(ctx: typer.Context, id: str):
     """
     Delete a product by its ID.
     """
-    global CLIENT
-    return sc.product.delete(client=CLIENT, id=id, console=CONSOLE)
+    return sc.product.delete(client=ctx.obj.client, id=id, console=ctx.obj.console)
 
 
 @product_app.command("search")
-def product_search(text: str):
+def product_search(ctx: typer.Context, text: str):
     """
     Search for products by name.
     """
-    global CLIENT, CONSOLE
+    from . import helper
 
-    response = sc.product.search(client=CLIENT, text=text, console=CONSOLE)
+    response = sc.product.search(
+        client=ctx.obj.client, text=text, console=ctx.obj.console
+    )
 
     table = helper.render_product_metadata_list(response)
 
-    CONSOLE.print(table)
+    ctx.obj.console.print(table)
 
 
 @product_app.command("cache")
-def product_cache(id: str):
+def product_cache(ctx: typer.Context, id: str):
     """
     Cache a product by its ID.
     """
-    global CLIENT, CACHE
-
-    response = sc.product.cache(client=CLIENT, cache=CACHE, id=id, console=CONSOLE)
+    response = sc.product.cache(
+        client=ctx.obj.client, cache=ctx.obj.cache, id=id, console=ctx.obj.console
+    )
 
-    CONSOLE.print(f"Cached product {id} including {len(response)} files")
+    ctx.obj.console.print(f"Cached product {id} including {len(response)} files")
 
 
 @product_app.command("download")
-def product_download(id: str, directory: str | None = None, slugify: bool = False):
+def product_download(
+    ctx: typer.Context, id: str, directory: str | None = None, slugify: bool = False
+):
     """
     Download a product to a location.
     """
-    global CLIENT
-
     directory = Path(directory or ".")
 
     response = sc.product.download(
-        client=CLIENT,
+        client=ctx.obj.client,
         id=id,
         directory=Path(directory),
-        console=CONSOLE,
+        console=ctx.obj.console,
         slugify=slugify,
     )
 
-    CONSOLE.print(f"Data cached to {response}")
+    ctx.obj.console.print(f"Data cached to {response}")
 
 
 @product_app.command("uncache")
-def product_uncache(id: str):
+def product_uncache(ctx: typer.Context, id: str):
     """
     Uncache a product by its ID.
     """
-    global CACHE
-
-    sc.product.uncache(client=CLIENT, cache=CACHE, id=id, console=CONSOLE)
+    sc.product.uncache(
+        client=ctx.obj.client, cache=ctx.obj.cache, id=id, console=ctx.obj.console
+    )
 
-    CONSOLE.print(f"Uncached product {id}")
+    ctx.obj.console.print(f"Uncached product {id}")
 
 
 @product_app.command("edit")
-def product_edit(id: str):
+def product_edit(ctx: typer.Context, id: str):
     """
     Edit a product by its ID.
     """
-    global CLIENT
+    from .textedit import edit_product
 
-    edit_product(client=CLIENT, id=id)
+    edit_product(client=ctx.obj.client, id=id)
 
 
 @product_app.command("add-reader")
-def product_add_reader(id: str, group: str):
+def product_add_reader(ctx: typer.Context, id: str, group: str):
     """
     Add a reader (by group name) to a product
     """
 
-    global CLIENT
     updated_id = sc.product.product_add_reader(
-        client=CLIENT, id=id, group=group, console=CONSOLE
+        client=ctx.obj.client, id=id, group=group, console=ctx.obj.console
     )
-    CONSOLE.print(f"Added {group} to {id} readers. New id is {updated_id}")
+    ctx.obj.console.print(f"Added {group} to {id} readers. New id is {updated_id}")
 
 
 @product_app.command("remove-reader")
-def product_remove_reader(id: str, group: str):
+def product_remove_reader(ctx: typer.Context, id: str, group: str):
     """
     Remove a reader (by group name) from a product
     """
 
-    global CLIENT
     updated_id = sc.product.product_remove_reader(
-        client=CLIENT, id=id, group=group, console=CONSOLE
+        client=ctx.obj.client, id=id, group=group, console=ctx.obj.console
     )
-    CONSOLE.print(f"Removed {group} from {id} readers. New id is {updated_id}")
+    ctx.obj.console.print(f"Removed {group} from {id} readers. New id is {updated_id}")
 
 
 @product_app.command("add-writer")
-def product_add_writer(id: str, group: str):
+def product_add_writer(ctx: typer.Context, id: str, group: str):
     """
     Add a writer (by group name) to a product
     """
 
-    global CLIENT
     updated_id = sc.product.product_add_writer(
-        client=CLIENT, id=id, group=group, console=CONSOLE
+        client=ctx.obj.client, id=id, group=group, console=ctx.obj.console
     )
-    CONSOLE.print(f"Added {group} to {id} writers. New id is {updated_id}")
+    ctx.obj.console.print(f"Added {group} to {id} writers. New id is {updated_id}")
 
 
 @product_app.command("remove-writer")
-def product_remove_writer(id: str, group: str):
+def product_remove_writer(ctx: typer.Context, id: str, group: str):
     """
     Remove a writer (by group name) from a product
     """
 
-    global CLIENT
     updated_id = sc.product.product_remove_writer(
-        client=CLIENT, id=id, group=group, console=CONSOLE
+        client=ctx.obj.client, id=id, group=group, console=ctx.obj.console
     )
-    CONSOLE.print(f"Removed {group} from {id} writers. New id is {updated_id}")
+    ctx.obj.console.print(f"Removed {group} from {id} writers. New id is {updated_id}")
 
 
 @product_app.command("add-child")
-def product_add_child(parent: str, child: str):
+def product_add_child(ctx: typer.Context, parent: str, child: str):
     """
     Add a child relationship between two products.
     """
-    global CLIENT
-
     sc.relationships.add_child(
-        client=CLIENT, parent=parent, child=child, console=CONSOLE
+        client=ctx.obj.client, parent=parent, child=child, console=ctx.obj.console
     )
-    CONSOLE.print(f"Added {child} as child of {parent}")
+    ctx.obj.console.print(f"Added {child} as child of {parent}")
 
 
 @product_app.command("remove-child")
-def product_remove_child(parent: str, child: str):
+def product_remove_child(ctx: typer.Context, parent: str, child: str):
     """
     Remove a child relationship between two products.
     """
-    global CLIENT
-
     sc.relationships.remove_child(
-        client=CLIENT, parent=parent, child=child, console=CONSOLE
+        client=ctx.obj.client, parent=parent, child=child, console=ctx.obj.console
     )
-    CONSOLE.print(f"Removed {child} as child of {parent}")
+    ctx.obj.console.print(f"Removed {child} as child of {parent}")
 
 
 @collection_app.command("read")
-def collection_read(id: str):
+def collection_read(ctx: typer.Context, id: str):
     """
     Read the information of a collection by its name.
     """
-    global CLIENT, CONSOLE
+    from rich.console import Group
+    from rich.styled import Styled
+
+    from . import helper
 
-    collection = sc.collections.read(client=CLIENT, id=id, console=CONSOLE)
+    console = ctx.obj.console
+
+    collection = sc.collections.read(client=ctx.obj.client, id=id, console=console)
 
     table = helper.render_product_metadata_list(collection.products)
 
-    CONSOLE.print(collection.name + "\n", style="bold underline color(3)")
-    CONSOLE.print(rich.markdown.Markdown(collection.description.strip("\n")))
-    CONSOLE.print("\n")
-    CONSOLE.print(table)
+    console.print(
+        Group(
+            Styled(
+                console.render_str(collection.name + "\n"),
+                "bold underline color(3)",
+            ),
+            helper.render_description(collection.description),
+            console.render_str("\n"),
+            table,
+        )
+    )
 
 
 @collection_app.command("search")
-def collection_search(name: str):
+def collection_search(ctx: typer.Context, name: str):
     """
     Search for collections by name.
     """
-    global CLIENT, CONSOLE
+    from . import helper
 
-    collections = sc.collections.search(client=CLIENT, name=name, console=CONSOLE)
+    collections = sc.collections.search(
+        client=ctx.obj.client, name=name, console=ctx.obj.console
+    )
 
     table = helper.render_collection_metadata_list(collections)
 
-    CONSOLE.print(table)
+    ctx.obj.console.print(table)
 
 
 @collection_app.command("cache")
-def collection_cache(id: str):
+def collection_cache(ctx: typer.Context, id: str):
     """
     Cache a collection by its ID.
     """
-    global CLIENT, CACHE, CONSOLE
-
     response = sc.collections.cache(
-        client=CLIENT, multi_cache=CACHE, id=id, console=CONSOLE
+        client=ctx.obj.client, multi_cache=ctx.obj.cache, id=id, console=ctx.obj.console
     )
 
-    CONSOLE.print(f"Cached collection {id} including {len(response)} files")
+    ctx.obj.console.print(f"Cached collection {id} including {len(response)} files")
 
 
 @collection_app.command("download")
-def collection_download(id: str, directory: str | None = None, slugify: bool = False):
+def collection_download(
+    ctx: typer.Context, id: str, directory: str | None = None, slugify: bool = False
+):
     """
     Download a collection by its ID.
     """
-    global CLIENT, CONSOLE
-
     directory = Path(directory or ".")
 
     response = sc.collections.download(
-        client=CLIENT, id=id, directory=directory, console=CONSOLE, slugify=slugify
+        client=ctx.obj.client,
+        id=id,
+        directory=directory,
+        console=ctx.obj.console,
+        slugify=slugify,
     )
 
-    CONSOLE.print(f"Downloaded collection to {response}")
+    ctx.obj.console.print(f"Downloaded collection to {response}")
 
 
 @collection_app.command("uncache")
-def collection_uncache(id: str):
+def collection_uncache(ctx: typer.Context, id: str):
     """
     Uncache a collection by its ID.
     """
-    global CACHE
-
-    sc.collections.uncache(client=CLIENT, cache=CACHE, id=id, console=CONSOLE)
+    sc.collections.uncache(
+        client=ctx.obj.client, cache=ctx.obj.cache, id=id, console=ctx.obj.console
+    )
 
-    CONSOLE.print(f"Uncached collection {id}")
+    ctx.obj.console.print(f"Uncached collection {id}")
 
 
 @collection_app.command("delete")
-def collection_delete(id: str):
+def collection_delete(ctx: typer.Context, id: str):
     """
     Delete a collection by its ID.
     """
-    global CLIENT
-
-    sc.collections.delete(client=CLIENT, id=id, console=CONSOLE)
+    sc.collections.delete(client=ctx.obj.client, id=id, console=ctx.obj.console)
 
-    CONSOLE.print(f"Deleted collection {id}")
+    ctx.obj.console.print(f"Deleted collection {id}")
 
 
 @collection_app.command("add-product")
-def collection_add_product(id: str, product_id: str):
+def collection_add_product(ctx: typer.Context, id: str, product_id: str):
     """
     Add a product to a collection.
     """
-    global CLIENT
     updated_id = sc.collections.add(
-        client=CLIENT, id=id, product=product_id, console=CONSOLE
+        client=ctx.obj.client, id=id, product=product_id, console=ctx.obj.console
+    )
+    ctx.obj.console.print(
+        f"Added {product_id} to {id} collection. New ID is {updated_id}"
     )
-    CONSOLE.print(f"Added {product_id} to {id} collection. New ID is {updated_id}")
 
 
 @collection_app.command("remove-product")
-def collection_remove_product(id: str, product_id: str):
+def collection_remove_product(ctx: typer.Context, id: str, product_id: str):
     """
     Remove a product from a collection.
     """
-    global CLIENT
     updated_id = sc.collections.remove(
-        client=CLIENT, id=id, product=product_id, console=CONSOLE
+        client=ctx.obj.client, id=id, product=product_id, console=ctx.obj.console
+    )
+    ctx.obj.console.print(
+        f"Removed {product_id} from {id} collection. New ID is {updated_id}"
     )
-    CONSOLE.print(f"Removed {product_id} from {id} collection. New ID is {updated_id}")
 
 
 @collection_app.command("add-collection")
-def collection_add_child(parent_id: str, child_id: str):
+def collection_add_child(ctx: typer.Context, parent_id: str, child_id: str):
     """
     Add a sub-collection to a collection.
     """
-    global CLIENT
     sc.relationships.add_child_collection(
-        client=CLIENT, parent=parent_id, child=child_id, console=CONSOLE
+        client=ctx.obj.client, parent=parent_id, child=child_id, console=ctx.obj.console
     )
-    CONSOLE.print(f"Added {child_id} to {parent_id} sub-collection")
+    ctx.obj.console.print(f"Added {child_id} to {parent_id} sub-collection")
 
 
 @collection_app.command("remove-collection")
-def collection_remove_child(parent_id: str, child_id: str):
+def collection_remove_child(ctx: typer.Context, parent_id: str, child_id: str):
     """
     Remove a sub-collection from a collection.
     """
-    global CLIENT
     sc.relationships.remove_child_collection(
-        client=CLIENT, parent=parent_id, child=child_id, console=CONSOLE
+        client=ctx.obj.client, parent=parent_id, child=child_id, console=ctx.obj.console
     )
-    CONSOLE.print(f"Removed {child_id} from {parent_id} sub-collection")
+    ctx.obj.console.print(f"Removed {child_id} from {parent_id} sub-collection")
 
 
 @collection_app.command("add-reader")
-def collection_add_reader(id: str, group: str):
+def collection_add_reader(ctx: typer.Context, id: str, group: str):
     """
     Add a reader (by group name) to a collection.
     """
-    global CLIENT
     updated_id = sc.collections.add_reader(
-        client=CLIENT, id=id, group=group, console=CONSOLE
+        client=ctx.obj.client, id=id, group=group, console=ctx.obj.console
     )
-    CONSOLE.print(f"Added {group} to readers. Collection ID is {updated_id}")
+    ctx.obj.console.print(f"Added {group} to readers. Collection ID is {updated_id}")
 
 
 @collection_app.command("remove-reader")
-def collection_remove_reader(id: str, group: str):
+def collection_remove_reader(ctx: typer.Context, id: str, group: str):
     """
     Remove a reader (by group name) from a collection.
     """
-    global CLIENT
     updated_id = sc.collections.remove_reader(
-        client=CLIENT, id=id, group=group, console=CONSOLE
+        client=ctx.obj.client, id=id, group=group, console=ctx.obj.console
+    )
+    ctx.obj.console.print(
+        f"Removed {group} from readers. Collection ID is {updated_id}"
     )
-    CONSOLE.print(f"Removed {group} from readers. Collection ID is {updated_id}")
 
 
 @collection_app.command("add-writer")
-def collection_add_writer(id: str, group: str):
+def collection_add_writer(ctx: typer.Context, id: str, group: str):
     """
     Add a writer (by group name) to a collection.
     """
-    global CLIENT
     updated_id = sc.collections.add_writer(
-        client=CLIENT, id=id, group=group, console=CONSOLE
+        client=ctx.obj.client, id=id, group=group, console=ctx.obj.console
     )
-    CONSOLE.print(f"Added {group} to writers. Collection ID is {updated_id}")
+    ctx.obj.console.print(f"Added {group} to writers. Collection ID is {updated_id}")
 
 
 @collection_app.command("remove-writer")
-def collection_remove_writer(id: str, group: str):
+def collection_remove_writer(ctx: typer.Context, id: str, group: str):
     """
     Remove a writer (by group name) from a collection.
     """
-    global CLIENT
     updated_id = sc.collections.remove_writer(
-        client=CLIENT, id=id, group=group, console=CONSOLE
+        client=ctx.obj.client, id=id, group=group, console=ctx.obj.console
+    )
+    ctx.obj.console.print(
+        f"Removed {group} from writers. Collection ID is {updated_id}"
     )
-    CONSOLE.print(f"Removed {group} from writers. Collection ID is {updated_id}")
 
 
 @cache_app.command("clear")
-def cache_clear(uuid: str):
+def cache_clear(ctx: typer.Context, uuid: str):
     """
     Clear the cache of a single file, labelled by its UUID (note that product IDs don't work here).
     """
-    global CACHE
-
-    for cache in CACHE.caches:
-        if cache.writeable:
-            sc.caching.clear_single(cache=cache, id=id, console=CONSOLE)
-            CONSOLE.print(f"Cleared cache {cache.path} of {id}")
+    for cache in ctx.obj.cache.writeable_caches:
+        sc.caching.clear_single(cache=cache, id=uuid)
+        ctx.obj.console.print(f"Cleared cache {cache.path} of {uuid}")
 
 
 @cache_app.command("clear-all")
-def cache_clear_all():
+def cache_clear_all(ctx: typer.Context):
     """
     Clear all caches of all files.
     """
-    global CACHE
-
-    for cache in CACHE.caches:
-        if cache.writeable:
-            sc.caching.clear_all(cache=cache)
-            CONSOLE.print(f"Cleared cache {cache.path}")
+    for cache in ctx.obj.cache.writeable_caches:
+        sc.caching.clear_all(cache=cache)
+        ctx.obj.console.print(f"Cleared cache {cache.path}")
 
 
 @dev_app.command("serve")
@@ -458,6 +514,29 @@ def dev_serve(
         exit(0)
 
 
+def _pull_images(*images: str):
+    """
+    Pull any of the docker images that aren't available locally. They are
+    pulled concurrently; starting the containers would otherwise pull them one
+    after the other.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    import docker
+    from docker.errors import ImageNotFound
+
+    client = docker.from_env()
+
+    def pull(image: str):
+        try:
+            client.images.get(image)
+        except ImageNotFound:
+            client.images.pull(image)
+
+    with ThreadPoolExecutor(max_workers=len(images)) as executor:
+        list(executor.map(pull, images))
+
+
 @dev_app.command("run")
 def dev_run(
     with_soauth: Annotated[
@@ -488,8 +567,13 @@ def dev_run(
 
     storage_kwargs = {}
 
-    with MongoDbContainer(**database_kwargs) as database_container:
-        with MinioContainer(**storage_kwargs) as storage_container:
+    database = MongoDbContainer(**database_kwargs)
+    storage = MinioContainer(**storage_kwargs)
+
+    _pull_images(database.image, storage.image)
+
+    with database as database_container:
+        with storage as storage_container:
             storage_config = storage_container.get_config()
             database_uri = database_container.get_connection_url()
 
@@ -528,12 +612,4 @@ def dev_run(
 
 
 def main():
-    settings = ClientSettings()
-
-    global CLIENT, APP, CACHE, CONSOLE
-
-    CLIENT = settings.client
-    CACHE = settings.cache
-    CONSOLE = rich.console.Console(quiet=not settings.verbose)
-
     APP()
@@ -2,19 +2,86 @@
 Methods for interacting with the collections layer of the hippo API
 """
 
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
 
-from httpx import Client
+from httpx import Client, HTTPStatusError
+from pydantic import TypeAdapter
 from rich.console import Console
 
-from hipposerve.api.models.relationships import ReadCollectionResponse
+from hipposerve.api.models.relationships import (
+    CreateCollectionTreeRequest,
+    ReadCollectionResponse,
+)
 
 from .core import MultiCache
-from .product import cache as cache_product
+from .product import cache_many as cache_products
 from .product import download as download_product
 from .product import uncache as uncache_product
 from .tools import slugify as apply_slugify
 
+MAX_CONCURRENT_PRODUCTS = 8
+
+_COLLECTION_LIST = TypeAdapter(list[ReadCollectionResponse])
+
+
+def __walk(client: Client, id: str, executor: Executor) -> list[ReadCollectionResponse]:
+    """
+    Read a collection and everything below it, each collection once. This is
+    a single request to the tree endpoint; servers without it are read one
+    level of the tree at a time, with the reads in each level made
+    concurrently.
+    """
+    try:
+        return read_tree(client, id)
+    except HTTPStatusError as e:
+        if e.response.status_code not in (404, 405):
+            raise
+
+    def read_child(child_id: str) -> ReadCollectionResponse | None:
+        # Like the tree endpoint, leave out children the user cannot read.
+        try:
+            return read(client, child_id)
+        except HTTPStatusError as e:
+            if e.response.status_code != 404:
+                raise
+
+            return None
+
+    collections = [read(client, id)]
+    seen = {id}
+    level = list(collections)
+
+    while level:
+        ids = []
+
+        for collection in level:
+            for child in collection.child_collections:
+                if (child_id := str(child.id)) not in seen:
+                    seen.add(child_id)
+                    ids.append(child_id)
+
+        level = [x for x in executor.map(read_child, ids) if x is not None]
+        collections += level
+
+    return collections
+
+
+def __run_all(executor: Executor, jobs: list) -> list:
+    """
+    Run zero-argument callables on the executor and return their results in
+    order. Work that has not started yet is cancelled on the first failure.
+    """
+    futures = [executor.submit(x) for x in jobs]
+
+    try:
+        return [x.result() for x in futures]
+    except BaseException:
+        for future in futures:
+            future.cancel()
+
+        raise
+
 
 def create(
     client: Client,
@@ -22,6 +89,8 @@ def create(
     description: str,
     readers: list[str] | None = None,
     writers: list[str] | None = None,
+    products: list[str] | None = None,
+    child_collections: list[str] | None = None,
     console: Console | None = None,
 ) -> str:
     """
@@ -39,6 +108,12 @@ def create(
         A list of groups that can read the collection.
     writers : list[str], optional
         A list of groups that can write to the collection.
+    products : list[str], optional
+        IDs of existing products to add to the collection on creation.
+    child_collections : list[str], optional
+        IDs of existing collections to add as children on creation. Servers
+        older than this client ignore `products` and `child_collections`, so
+        the two must be upgraded together.
     console : Console, optional
         The Console to use to print to.
 
@@ -59,6 +134,10 @@ def create(
         content["readers"] = readers
     if writers is not None:
         content["writers"] = writers
+    if products:
+        content["products"] = products
+    if child_collections:
+        content["child_collections"] = child_collections
 
     response = client.put(f"/relationships/collection/{name}", json=content)
 
@@ -70,6 +149,51 @@ def create(
     return response.json()
 
 
+def create_tree(
+    client: Client,
+    collections: list[CreateCollectionTreeRequest],
+    console: Console | None = None,
+) -> list[str]:
+    """
+    Create several collections in hippo with a single request.
+
+    Arguments
+    ---------
+    client : Client
+        The client to use for interacting with the hippo API.
+    collections : list[CreateCollectionTreeRequest]
+        The collections to create. Collections created by the same request
+        are linked as children through `child_indices`, which must point to
+        entries earlier in the list.
+    console : Console, optional
+        The Console to use to print to.
+
+    Returns
+    -------
+    list[str]
+        The IDs of the collections created, in the same order.
+
+    Raises
+    ------
+    httpx.HTTPStatusError
+        If a request to the API fails
+    """
+
+    response = client.put(
+        "/relationships/collections",
+        json=[x.model_dump(mode="json") for x in collections],
+    )
+
+    response.raise_for_status()
+
+    if console:
+        console.print(
+            f"Successfully created {len(collections)} collections.", style="bold green"
+        )
+
+    return response.json()
+
+
 def read(
     client: Client, id: str, console: Console | None = None
 ) -> ReadCollectionResponse:
@@ -108,6 +232,51 @@ def read(
     return model
 
 
+def read_tree(
+    client: Client, id: str, depth: int | None = None, console: Console | None = None
+) -> list[ReadCollectionResponse]:
+    """
+    Read a collection and all of its descendants from hippo in one request.
+
+    Arguments
+    ---------
+    client: Client
+        The client to use for interacting with the hippo API.
+    id : str
+        The id of the collection to read.
+    depth : int, optional
+        How many levels of child collections to read. Defaults to all of them.
+    console : Console, optional
+        The Console to use to print to.
+
+    Returns
+    -------
+    list[ReadCollectionResponse]
+        The collection itself, followed by each of its descendants once.
+
+    Raises
+    ------
+    httpx.HTTPStatusError
+        If a request to the API fails
+    """
+
+    params = {} if depth is None else {"depth": depth}
+
+    response = client.get(f"/relationships/collection/{id}/tree", params=params)
+
+    response.raise_for_status()
+
+    models = _COLLECTION_LIST.validate_json(response.content)
+
+    if console:
+        console.print(
+            f"Successfully read collection {models[0].name} ({id}) and "
+            f"{len(models) - 1} descendants"
+        )
+
+    return models
+
+
 def add_reader(
     client: Client, id: str, group: str, console: Console | None = None
 ) -> str:
@@ -190,7 +359,7 @@ def search(
 
     response.raise_for_status()
 
-    models = [ReadCollectionResponse.model_validate(x) for x in response.json()]
+    models = _COLLECTION_LIST.validate_json(response.content)
 
     if console:
         console.print(f"Successfully searched for collection {name}")
@@ -232,6 +401,42 @@ def add(client: Client, id: str, product: str, console: Console | None = None) -
     return True
 
 
+def add_many(
+    client: Client, id: str, products: list[str], console: Console | None = None
+) -> bool:
+    """
+    Add several products to a collection in hippo with a single request.
+
+    Arguments
+    ---------
+    client: Client
+        The client to use for interacting with the hippo API.
+    id : str
+        The id of the collection to add the products to.
+    products : list[str]
+        The ids of the products to add to the collection.
+    console: Console, optional
+        The rich console to print to.
+
+    Raises
+    ------
+    httpx.HTTPStatusError
+        If a request to the API fails
+    """
+
+    response = client.post(f"/relationships/collection/{id}/products", json=products)
+
+    response.raise_for_status()
+
+    if console:
+        console.print(
+            f"Successfully added {len(products)} products to collection {id}.",
+            style="bold green",
+        )
+
+    return True
+
+
 def remove(
     client: Client, id: str, product: str, console: Console | None = None
 ) -> bool:
@@ -327,17 +532,16 @@ def cache(
         If the cache is not writeable
     """
 
-    collection = read(client, id)
-
-    paths = []
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PRODUCTS) as executor:
+        collections = __walk(client, id, executor)
 
-    for product in collection.products:
-        paths += cache_product(client, multi_cache, str(product.id))
-
-    for child in collection.child_collections:
-        paths += cache(client, multi_cache, str(child.id))
+    # Products that are in more than one collection are only cached once, and
+    # all of them are read from the server together.
+    results = cache_products(
+        client, multi_cache, [str(x.id) for c in collections for x in c.products]
+    )
 
-    return paths
+    return [path for paths in results.values() for path in paths]
 
 
 def download(
@@ -362,7 +566,8 @@ def download(
 
     Inside the provided directory, we create a new directory with the collection name.
     In there we store each product and child collection recursively, and store
-    the metadata for the collection as `collection.json`.
+    the metadata for the collection as `collection.json`. Child collections
+    that the user cannot read are skipped.
 
     Arguments
     ---------
@@ -390,7 +595,54 @@ def download(
         If the directory does not exist or is not a directory.
     """
 
-    collection = read(client, id)
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PRODUCTS) as executor:
+        collections = {str(x.id): x for x in __walk(client, str(id), executor)}
+
+        # The directories are laid out first, so that all of the products in
+        # the tree can then be downloaded concurrently.
+        downloads = []
+
+        collection_directory = __lay_out(
+            collections=collections,
+            id=str(id),
+            directory=directory,
+            downloads=downloads,
+            console=console,
+            slugify=slugify,
+        )
+
+        __run_all(
+            executor,
+            [
+                lambda x=x: download_product(
+                    client=client,
+                    id=x[0],
+                    directory=x[1],
+                    console=console,
+                    slugify=slugify,
+                    show_progress=False,
+                )
+                for x in downloads
+            ],
+        )
+
+    return collection_directory
+
+
+def __lay_out(
+    collections: dict[str, ReadCollectionResponse],
+    id: str,
+    directory: Path,
+    downloads: list[tuple[str, Path]],
+    console: Console | None,
+    slugify: bool,
+    ancestors: frozenset[str] = frozenset(),
+) -> Path:
+    """
+    Create the directory and metadata for a collection and its children, and
+    record the (product ID, directory) pairs that need downloading.
+    """
+    collection = collections[id]
 
     if slugify:
         collection.name = apply_slugify(collection.name)
@@ -407,22 +659,32 @@ def download(
                 f"Successfully wrote metadata for collection {collection.name}"
             )
 
-    for product in collection.products:
-        download_product(
-            client=client,
-            id=product.id,
-            directory=collection_directory,
-            console=console,
-            slugify=slugify,
-        )
+    downloads += [(str(x.id), collection_directory) for x in collection.products]
+
+    ancestors = ancestors | {id}
 
     for child in collection.child_collections:
-        download(
-            client=client,
-            id=child.id,
+        if (child_id := str(child.id)) in ancestors:
+            continue
+
+        if child_id not in collections:
+            # The tree read leaves out children the user cannot read.
+            if console:
+                console.print(
+                    f"Skipping child collection {child.name} ({child_id}), "
+                    "which could not be read",
+                    style="yellow",
+                )
+            continue
+
+        __lay_out(
+            collections=collections,
+            id=child_id,
             directory=collection_directory,
+            downloads=downloads,
             console=console,
             slugify=slugify,
+            ancestors=ancestors,
         )
 
     return collection_directory
@@ -453,5 +715,13 @@ def uncache(
 
     collection = read(client, id)
 
-    for product in collection.products:
-        uncache_product(client, cache, product.id)
+    # Products without a record of their cached sources are read from the
+    # server first, so these are run concurrently too.
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PRODUCTS) as executor:
+        __run_all(
+            executor,
+            [
+                lambda x=x: uncache_product(client, cache, str(x.id))
+                for x in collection.products
+            ],
+        )
@@ -21,9 +21,34 @@ def Client(
     host: str,
     token_tag: str | None,
     timeout: int | None = None,
+    http2: bool = False,
+    max_connections: int = 100,
 ) -> httpx.Client:
     auth = SOAuth(token_tag) if token_tag else None
-    return httpx.Client(base_url=host, auth=auth, timeout=httpx.Timeout(timeout or 60))
+
+    if http2:
+        # HTTP/2 needs the (optional) h2 package; fall back to HTTP/1.1
+        # connections if it is not installed.
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            http2 = False
+
+    # Connections are kept for longer than the httpx default (5 s), so that
+    # they survive the gaps between successive pushes and pulls.
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=30.0,
+    )
+
+    return httpx.Client(
+        base_url=host,
+        auth=auth,
+        timeout=httpx.Timeout(timeout or 60),
+        limits=limits,
+        http2=http2,
+    )
 
 
 class ClientSettings(BaseSettings):
@@ -45,6 +70,14 @@ class ClientSettings(BaseSettings):
     "The size of the multipart upload parts in bytes. If set to zero, no multipart uploads will be used"
     client_timeout: int = 60
     "The timeout for the client in seconds. Default is 60 seconds (up from the httpx default of 5)"
+    upload_workers: int = 4
+    "The number of products to upload at the same time when pushing collections"
+    metadata_max_age: int = 0
+    "Serve cached collection metadata up to this many seconds old while refreshing it in the background. Zero (the default) always reads from the server"
+    http2: bool = False
+    "Use HTTP/2 to talk to the server, letting concurrent requests share one connection. Requires the h2 package (pip install pyhippo[http2])"
+    max_connections: int = 100
+    "The largest number of connections to the server and object store. All of them are kept alive between requests so that concurrent uploads can reuse them"
 
     default_readers: list[str] = []
     "Default readers for new collections and products"
@@ -87,5 +120,9 @@ class ClientSettings(BaseSettings):
         Return a Client object for the API.
         """
         return Client(
-            token_tag=self.token_tag, host=self.host, timeout=self.client_timeout
+            token_tag=self.token_tag,
+            host=self.host,
+            timeout=self.client_timeout,
+            http2=self.http2,
+            max_connections=self.max_connections,
         )
@@ -1,3 +1,5 @@
+from contextlib import nullcontext
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -13,6 +15,9 @@ from rich.progress import (
     TransferSpeedColumn,
 )
 
+DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+CHECKSUM_CHUNK_SIZE = 4 * 1024 * 1024
+
 
 def downloader(
     presigned_url: str,
@@ -35,19 +40,40 @@ def downloader(
                 )
 
                 task_id = progress.add_task("Downloading", total=total)
+            else:
+                progress = nullcontext()
 
             with progress, open(output_destination, "wb") as f:
-                for chunk in response.iter_bytes(chunk_size=8192):
+                for chunk in response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     f.write(chunk)
                     if console:
                         progress.update(task_id, advance=len(chunk))
 
 
-def file_info(filename: Path, description: str | None = None) -> dict:
+@lru_cache(maxsize=1024)
+def _checksum(filename: str, modified: int, size: int) -> str:
+    # Hash in chunks, in file order, so that large sources (e.g. compressed
+    # archives) are never read into memory in one go. The modification time
+    # and size are only part of the cache key.
+    hasher = xxhash.xxh64()
+
     with open(filename, "rb") as handle:
-        return {
-            "name": filename.name,
-            "size": filename.stat().st_size,
-            "checksum": f"xxh64:{xxhash.xxh64(handle.read()).hexdigest()}",
-            "description": description,
-        }
+        while chunk := handle.read(CHECKSUM_CHUNK_SIZE):
+            hasher.update(chunk)
+
+    return f"xxh64:{hasher.hexdigest()}"
+
+
+def file_info(filename: Path, description: str | None = None) -> dict:
+    stat = filename.stat()
+
+    # Files that have not changed since they were last hashed (e.g. when
+    # retrying a failed upload) are not read again.
+    checksum = _checksum(str(filename.absolute()), stat.st_mtime_ns, stat.st_size)
+
+    return {
+        "name": filename.name,
+        "size": stat.st_size,
+        "checksum": checksum,
+        "description": description,
+    }
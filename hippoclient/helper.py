@@ -3,6 +3,9 @@ Helpers for rendering cli elements.
 """
 
 import rich
+import rich.console
+import rich.table
+import rich.text
 
 from hippoclient.caching import MultiCache
 from hipposerve.api.models.relationships import (
@@ -11,6 +14,9 @@ from hipposerve.api.models.relationships import (
 )
 from hipposerve.database import FileMetadata, ProductMetadata
 
+# Characters that can give a single line of text a meaning in Markdown.
+MARKDOWN_CHARACTERS = frozenset("\\`*_[]<>&!#|~")
+
 
 def render_version_list(
     versions: list[str], current_version: str, requested_version: str
@@ -120,3 +126,29 @@ def render_source_list(
         )
 
     return table
+
+
+def render_description(description: str) -> rich.console.RenderableType:
+    """
+    Render a product or collection description. Descriptions are Markdown,
+    but most are a single line of plain text; those are shown as they are,
+    without loading and running the Markdown parser.
+    """
+
+    description = description.strip("\n")
+
+    if not description:
+        return rich.console.Group()
+
+    if (
+        "\n" not in description
+        and MARKDOWN_CHARACTERS.isdisjoint(description)
+        and not description[:1].isdigit()
+        and not description[:1].isspace()
+        and description[:1] not in ("-", "+", "=")
+    ):
+        return rich.text.Text(description)
+
+    from rich.markdown import Markdown
+
+    return Markdown(description)
@@ -2,16 +2,19 @@
 Methods for interacting with the product layer of the hippo API.
 """
 
+import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from httpx import Client, Response
+from httpx import Client, HTTPStatusError, Response
+from pydantic import TypeAdapter
 from rich.console import Console
 from tqdm import tqdm
 
 from hippoclient.downloads import downloader, file_info
 from hippometa import ALL_METADATA_TYPE
 from hippometa.simple import SimpleMetadata
-from hipposerve.api.models.product import ReadProductResponse
+from hipposerve.api.models.product import ReadFilesResponse, ReadProductResponse
 from hipposerve.database import ProductMetadata
 from hipposerve.service.product import PostUploadFile, PreUploadFile
 
@@ -19,6 +22,125 @@ from .core import MultiCache
 from .tools import slugify as apply_slugify
 
 MULTIPART_UPLOAD_SIZE = 50 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+MAX_CONCURRENT_UPLOADS = 8
+MAX_CONCURRENT_DOWNLOADS = 8
+
+_METADATA_LIST = TypeAdapter(list[ProductMetadata])
+_FILES_LIST = TypeAdapter(list[ReadFilesResponse])
+
+
+def __manifest_key(id: str) -> str:
+    """
+    The metadata cache key under which the sources of a fully cached product
+    are recorded, as a list of [name, uuid] pairs.
+    """
+    return f"product-sources:{id}"
+
+
+def __read_manifest(cache: MultiCache, id: str) -> list[tuple[str, str]] | None:
+    """
+    The [name, uuid] pairs of a product's sources as recorded when it was last
+    fully cached, or None if it never was. A product's ID always refers to the
+    same files (any change creates a new version), so these never go stale.
+    """
+    manifest = cache.get_metadata(key=__manifest_key(id), max_age=float("inf"))
+
+    return None if manifest is None else json.loads(manifest)
+
+
+def __read_block(file, start: int, length: int):
+    """
+    Stream `length` bytes of an open file, starting at `start`, in chunks.
+    """
+    file.seek(start)
+
+    while length > 0:
+        chunk = file.read(min(UPLOAD_CHUNK_SIZE, length))
+
+        if not chunk:
+            break
+
+        length -= len(chunk)
+
+        yield chunk
+
+
+def __upload_source(
+    source: Path,
+    upload_urls: list[str],
+    client: Client,
+    console: Console | None = None,
+    show_progress: bool = True,
+) -> tuple[list[dict[str, str]], list[int]]:
+    """
+    Upload a single source to its presigned URLs, one multipart block per URL.
+    Returns the response headers and the size of each block.
+    """
+    headers = []
+    size = []
+
+    total_size = source.stat().st_size
+
+    with source.open("rb") as file:
+        if console:
+            console.print("Uploading file:", source.name)
+
+        # We need to handle our own redirects because otherwise the head of the file will be incorrect,
+        # and we will end up with Content-Length errors. Blocks are streamed from disk rather than
+        # held in memory, so they can't be replayed by httpx anyway.
+
+        with tqdm(
+            desc=f"Uploading {source.name}",
+            total=total_size,
+            unit="B",
+            unit_scale=True,
+            unit_divisor=1024,
+            disable=not show_progress,
+        ) as t:
+            file_position = 0
+
+            for upload_url in upload_urls:
+                block_size = max(
+                    0, min(MULTIPART_UPLOAD_SIZE, total_size - file_position)
+                )
+
+                while True:
+                    individual_response = client.put(
+                        upload_url.strip(),
+                        content=__read_block(file, file_position, block_size),
+                        # Object stores reject chunked uploads, so the length
+                        # must be given up-front.
+                        headers={"Content-Length": str(block_size)},
+                        follow_redirects=False,
+                        auth=None,
+                        # Blocks are 50 MB so may timeout on slow connections
+                        # (httpx defaults to 5 seconds)
+                        timeout=120.0,
+                    )
+
+                    if individual_response.status_code in [301, 302, 307, 308]:
+                        if console:
+                            console.print(
+                                f"Redirected to {individual_response.headers['Location']} from {upload_url}"
+                            )
+                        upload_url = individual_response.headers["Location"]
+
+                        continue
+                    else:
+                        individual_response.raise_for_status()
+                        break
+
+                headers.append(dict(individual_response.headers))
+                size.append(block_size)
+
+                file_position += MULTIPART_UPLOAD_SIZE
+                t.update(block_size)
+
+    if console:
+        console.print("Successfully uploaded file:", source.name)
+
+    return headers, size
 
 
 def __upload_sources(
@@ -27,80 +149,40 @@ def __upload_sources(
     sources: dict[str, PreUploadFile],
     this_product_id: str,
     console: Console | None = None,
-) -> dict[str, list[dict[str, str]]]:
+    confirm: bool = False,
+) -> bool | None:
     responses = {}
     sizes = {}
 
-    # Upload the sources to the presigned URLs.
-    for source in sources.values():
-        with source.open("rb") as file:
-            if console:
-                console.print("Uploading file:", source.name)
-
-            upload_urls = initial_response.json()["upload_urls"][source.name]
-            headers = []
-            size = []
-
-            # We need to handle our own redirects because otherwise the head of the file will be incorrect,
-            # and we will end up with Content-Length errors.
-
-            with tqdm(
-                desc="Uploading",
-                total=source.stat().st_size,
-                unit="B",
-                unit_scale=True,
-                unit_divisor=1024,
-            ) as t:
-                file_position = 0
-
-                for upload_url in upload_urls:
-                    retry = True
-
-                    while retry:
-                        file.seek(file_position)
-
-                        data = file.read(MULTIPART_UPLOAD_SIZE)
-
-                        individual_response = client.put(
-                            upload_url.strip(),
-                            content=data,
-                            follow_redirects=True,
-                            auth=None,
-                            # Blocks are 50 MB so may timeout on slow connections
-                            # (httpx defaults to 5 seconds)
-                            timeout=120.0,
-                        )
-
-                        if individual_response.status_code in [301, 302, 307, 308]:
-                            if console:
-                                console.print(
-                                    f"Redirected to {individual_response.headers['Location']} from {upload_url}"
-                                )
-                            upload_url = individual_response.headers["Location"]
-
-                            continue
-                        else:
-                            retry = False
-                            individual_response.raise_for_status()
-                            break
-
-                    headers.append(dict(individual_response.headers))
-                    size.append(len(data))
-
-                    file_position += MULTIPART_UPLOAD_SIZE
-                    t.update(len(data))
-
-            responses[source.name] = headers
-            sizes[source.name] = size
-
-            if console:
-                console.print("Successfully uploaded file:", source.name)
+    upload_urls = initial_response.json()["upload_urls"]
+
+    # Upload the sources to the presigned URLs. Each source is independent
+    # so we upload them concurrently; the httpx client is thread-safe.
+    # Progress bars would interleave, so they are only shown for a single
+    # upload.
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(MAX_CONCURRENT_UPLOADS, len(sources)))
+    ) as executor:
+        futures = {
+            source.name: executor.submit(
+                __upload_source,
+                source=source,
+                upload_urls=upload_urls[source.name],
+                client=client,
+                console=console,
+                show_progress=len(sources) == 1,
+            )
+            for source in sources.values()
+        }
+
+        for name, future in futures.items():
+            responses[name], sizes[name] = future.result()
 
     if sources:
         # Close out the upload.
         response = client.post(
             f"/product/{this_product_id}/complete",
-            json={"headers": responses, "sizes": sizes},
+            json={"headers": responses, "sizes": sizes, "confirm": confirm},
         )
 
         response.raise_for_status()
@@ -201,12 +283,14 @@ def create(
 
     this_product_id = response.json()["id"]
 
-    __upload_sources(
+    # The sources are confirmed as part of completing the upload.
+    confirmed = __upload_sources(
         initial_response=response,
         client=client,
         sources=sources,
         this_product_id=this_product_id,
         console=console,
+        confirm=True,
     )
 
     if console:
@@ -214,10 +298,12 @@ def create(
             f"Successfully created product {this_product_id} in remote database."
         )
 
-    # Confirm the upload to hippo.
-    response = client.post(f"/product/{this_product_id}/confirm")
+    if sources and not confirmed:
+        # Older servers can't confirm while completing, so confirm the
+        # upload to hippo separately.
+        response = client.post(f"/product/{this_product_id}/confirm")
 
-    response.raise_for_status()
+        response.raise_for_status()
 
     if console:
         console.print(f"Successfully completed upload of {name}.", style="bold green")
@@ -474,7 +560,7 @@ def search(
 
     response.raise_for_status()
 
-    models = [ProductMetadata.model_validate(x) for x in response.json()]
+    models = _METADATA_LIST.validate_json(response.content)
 
     if console:
         console.print(f"Successfully searched for products matching {text}")
@@ -482,8 +568,141 @@ def search(
     return models
 
 
+def __cached_sources(
+    cache: MultiCache, id: str, console: Console | None
+) -> list[Path] | None:
+    """
+    The paths to a product's sources if all of them are still in the cache,
+    found without any request to the server. Otherwise, None.
+    """
+    if (manifest := __read_manifest(cache, id)) is None:
+        return None
+
+    available = cache.available_many([uuid for _, uuid in manifest])
+
+    if len(available) != len(manifest):
+        return None
+
+    if console:
+        console.print(f"Found cached product {id}", style="green")
+
+    return [available[uuid] for _, uuid in manifest]
+
+
+def __missing_endpoint(response: Response) -> bool:
+    """
+    Whether a failed request was for an endpoint the server does not have,
+    rather than for a product that it does not have (or that can't be read).
+    """
+    if response.status_code == 405:
+        return True
+
+    if response.status_code != 404:
+        return False
+
+    try:
+        detail = response.json().get("detail")
+    except ValueError:
+        return True
+
+    return detail != "Product not found"
+
+
+def __read_files(
+    client: Client, id: str, console: Console | None
+) -> dict[str, PostUploadFile]:
+    """
+    Read a product's files, including pre-signed URLs for downloads.
+    """
+    response = client.get(f"/product/{id}/files")
+
+    response.raise_for_status()
+
+    post_upload_files = ReadFilesResponse.model_validate_json(response.content).files
+
+    if console:
+        console.print(f"Successfully read product {id}")
+
+    return post_upload_files
+
+
+def __cache_sources(
+    cache: MultiCache,
+    id: str,
+    post_upload_files: dict[str, PostUploadFile],
+    console: Console | None,
+    show_progress: bool,
+) -> list[Path]:
+    """
+    Cache the sources of a product, given their pre-signed URLs, and record
+    them so that the product can later be found in the cache directly.
+    """
+    response_paths = []
+    missing = []
+
+    # See which are already cached.
+    available = cache.available_many([x.uuid for x in post_upload_files.values()])
+
+    for file in post_upload_files.values():
+        if (cached := available.get(file.uuid)) is not None:
+            response_paths.append(cached)
+
+            if console:
+                console.print(f"Found cached file {file.name}", style="green")
+
+            continue
+
+        if console:
+            console.print(
+                f"File {file.name} ({file.uuid}) not found in cache", style="red"
+            )
+
+        missing.append((len(response_paths), file))
+        response_paths.append(None)
+
+    # Sources are independent, so the missing ones are downloaded
+    # concurrently. Progress bars would interleave, so they are only shown
+    # for a single download.
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(MAX_CONCURRENT_DOWNLOADS, len(missing)))
+    ) as executor:
+        futures = [
+            (
+                index,
+                file,
+                executor.submit(
+                    cache.get,
+                    id=file.uuid,
+                    path=file.object_name,
+                    checksum=file.checksum,
+                    size=file.size,
+                    presigned_url=file.url,
+                    show_progress=show_progress and len(missing) == 1,
+                ),
+            )
+            for index, file in missing
+        ]
+
+        for index, file, future in futures:
+            response_paths[index] = future.result()
+
+            if console:
+                console.print(f"Cached file {file.name} ({file.uuid})", style="yellow")
+
+    cache.set_metadata(
+        key=__manifest_key(id),
+        value=json.dumps([[x.name, x.uuid] for x in post_upload_files.values()]),
+    )
+
+    return response_paths
+
+
 def cache(
-    client: Client, cache: MultiCache, id: str, console: Console | None = None
+    client: Client,
+    cache: MultiCache,
+    id: str,
+    console: Console | None = None,
+    show_progress: bool = True,
 ) -> list[Path]:
     """
     Cache a product from hippo.
@@ -498,6 +717,9 @@ def cache(
         The ID of the product to cache.
     console : Console, optional
         The rich console to print to.
+    show_progress : bool, optional
+        Whether to show a progress bar when a single source is downloaded.
+        Turn this off when caching products concurrently.
 
     Returns
     -------
@@ -512,50 +734,132 @@ def cache(
         If the cache is not writeable
     """
 
-    response = client.get(f"/product/{id}/files")
+    # Re-caching a product whose sources are all still in the cache needs no
+    # request to the server at all.
+    if (paths := __cached_sources(cache, id, console)) is not None:
+        return paths
+
+    post_upload_files = __read_files(client, id, console)
+
+    return __cache_sources(cache, id, post_upload_files, console, show_progress)
+
+
+def read_files_many(
+    client: Client, ids: list[str], console: Console | None = None
+) -> list[ReadFilesResponse]:
+    """
+    Read the files of several products, including pre-signed URLs for
+    downloads, in a single request.
+
+    Arguments
+    ----------
+    client: Client
+        The client to use for interacting with the hippo API.
+    ids : list[str]
+        The IDs of the products to read.
+    console : Console, optional
+        The rich console to print to.
+
+    Returns
+    -------
+    list[ReadFilesResponse]
+        The product metadata and files for each product, in the order of
+        ``ids``, with each product included once.
+
+    Raises
+    ------
+    httpx.HTTPStatusError
+        If a request to the API fails
+    """
+
+    response = client.post("/product/files", json=ids)
 
     response.raise_for_status()
 
-    post_upload_files = {
-        x: PostUploadFile.model_validate(y) for x, y in response.json()["files"].items()
-    }
+    models = _FILES_LIST.validate_json(response.content)
 
     if console:
-        console.print(f"Successfully read product {id}")
+        console.print(f"Successfully read files for {len(models)} products")
 
-    response_paths = []
+    return models
 
-    for file in post_upload_files.values():
-        # See if it's already cached.
-        try:
-            cached = cache.available(file.uuid)
-            response_paths.append(cached)
 
-            if console:
-                console.print(f"Found cached file {file.name}", style="green")
+def cache_many(
+    client: Client,
+    cache: MultiCache,
+    ids: list[str],
+    console: Console | None = None,
+) -> dict[str, list[Path]]:
+    """
+    Cache several products from hippo. Products that are fully cached already
+    need no request; the rest are read in a single request (or one request
+    each, from servers that can't read them together), and then cached
+    concurrently.
 
-            continue
-        except FileNotFoundError:
-            if console:
-                console.print(
-                    f"File {file.name} ({file.uuid}) not found in cache", style="red"
-                )
-            cached = None
-
-        cached = cache.get(
-            id=file.uuid,
-            path=file.object_name,
-            checksum=file.checksum,
-            size=file.size,
-            presigned_url=file.url,
+    Arguments
+    ----------
+    client: Client
+        The client to use for interacting with the hippo API.
+    cache: MultiCache
+        The cache to use for storing the products.
+    ids : list[str]
+        The IDs of the products to cache.
+    console : Console, optional
+        The rich console to print to.
+
+    Returns
+    -------
+    dict[str, list[Path]]
+        The paths to the cached sources of each product, in the order of
+        ``ids``, with each product included once.
+
+    Raises
+    ------
+    httpx.HTTPStatusError
+        If a request to the API fails
+    CacheNotWriteableError
+        If the cache is not writeable
+    """
+
+    paths = {id: __cached_sources(cache, id, console) for id in ids}
+    needed = [id for id, found in paths.items() if found is None]
+
+    if not needed:
+        return paths
+
+    try:
+        files = {
+            str(x.product.id): x.files
+            for x in read_files_many(client, needed, console=console)
+        }
+    except HTTPStatusError as e:
+        if not __missing_endpoint(e.response):
+            raise
+
+        files = None
+
+    def cache_product(id: str) -> list[Path]:
+        post_upload_files = (
+            __read_files(client, id, console) if files is None else files[id]
         )
 
-        response_paths.append(cached)
+        return __cache_sources(
+            cache, id, post_upload_files, console, show_progress=False
+        )
 
-        if console:
-            console.print(f"Cached file {file.name} ({file.uuid})", style="yellow")
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DOWNLOADS) as executor:
+        futures = [executor.submit(cache_product, x) for x in needed]
 
-    return response_paths
+        try:
+            for id, future in zip(needed, futures):
+                paths[id] = future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+
+            raise
+
+    return paths
 
 
 def download(
@@ -565,6 +869,7 @@ def download(
     console: Console | None = None,
     slugs: list[str] | None = None,
     slugify: bool = False,
+    show_progress: bool = True,
 ) -> Path:
     """
     Download a product from HIPPO onto the local filesystem, storing the data
@@ -595,6 +900,10 @@ def download(
     slugify : bool, optional
         Whether to convert product names into 'slugified' versions
         that are esaier to read as directory names.
+    show_progress : bool, optional
+        Whether to show progress bars for the downloads on the console.
+        Only one can be shown at a time, so turn this off when downloading
+        products concurrently.
 
     Returns
     -------
@@ -613,11 +922,9 @@ def download(
 
     response.raise_for_status()
 
-    post_upload_files = {
-        x: PostUploadFile.model_validate(y) for x, y in response.json()["files"].items()
-    }
-
-    metadata = ProductMetadata.model_validate(response.json()["product"])
+    files = ReadFilesResponse.model_validate_json(response.content)
+    post_upload_files = files.files
+    metadata = files.product
 
     if console:
         console.print(f"Successfully read product {id}")
@@ -654,7 +961,7 @@ def download(
         downloader(
             presigned_url=source_data.url,
             output_destination=slug_path,
-            console=console,
+            console=console if show_progress else None,
         )
 
         if console:
@@ -681,13 +988,15 @@ def uncache(
         The rich console to print to.
     """
 
-    product = read(client, id)
+    if (manifest := __read_manifest(cache, id)) is None:
+        product = read(client, id)
+        manifest = [(x.name, x.uuid) for x in product.sources.values()]
 
-    for source in product.sources.values():
-        cache.remove(source.uuid)
+    for name, uuid in manifest:
+        cache.remove(uuid)
 
         if console:
-            console.print(f"Removed file {source.name} ({source.uuid}) from cache")
+            console.print(f"Removed file {name} ({uuid}) from cache")
 
     return
 
@@ -129,6 +129,50 @@ def add_child_collection(
     return True
 
 
+def add_child_collections(
+    client: Client, parent: str, children: list[str], console: Console | None = None
+) -> bool:
+    """
+    Add child relationships between a collection and several other collections
+    with a single request.
+
+    Arguments
+    ---------
+    client : Client
+        The client to use for interacting with the hippo API.
+    parent : str
+        The ID of the parent collection.
+    children : list[str]
+        The IDs of the child collections.
+    console : Console, optional
+        The rich console to print to.
+
+    Returns
+    -------
+    bool
+        True if the relationships were added successfully.
+
+    Raises
+    ------
+    httpx.HTTPStatusError
+        If a request to the API fails
+    """
+
+    response = client.post(
+        f"/relationships/collection/{parent}/children", json=children
+    )
+
+    response.raise_for_status()
+
+    if console:
+        console.print(
+            f"Successfully added {len(children)} child collections to {parent}.",
+            style="bold green",
+        )
+
+    return True
+
+
 def remove_child_collection(
     client: Client, parent: str, child: str, console: Console | None = None
 ) -> bool:
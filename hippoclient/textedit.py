@@ -7,7 +7,6 @@ import ast
 import json
 from pathlib import Path
 
-import xxhash
 from beanie import PydanticObjectId
 from textual import on
 from textual.app import App, ComposeResult
@@ -31,6 +30,7 @@ from hippometa import ALL_METADATA, ALL_METADATA_TYPE
 
 from . import product
 from .core import Client
+from .downloads import file_info
 
 
 class EditorApp(App):
@@ -318,15 +318,7 @@ class EditorApp(App):
             self.generate_metadata_fields()
 
     def get_file_metadata(self, path, source_description):
-        source = Path(path)
-        with source.open("rb") as file:
-            file_info = {
-                "name": source.name,
-                "size": source.stat().st_size,
-                "checksum": f"xxh64:{xxhash.xxh64(file.read()).hexdigest()}",
-                "description": source_description,
-            }
-            return file_info
+        return file_info(Path(path), description=source_description)
 
     def get_new_source(self):
         file_path = self.query_one("#new-source-file-path").value
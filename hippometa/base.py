@@ -2,11 +2,20 @@
 Base metadata type that all metadata must inherit from
 """
 
-from typing import ClassVar
+from typing import Any, ClassVar, Self
 
 from pydantic import BaseModel
 
 
 class BaseMetadata(BaseModel):
     metadata_type: str
-    valid_slugs: ClassVar[set[str]] = {"data"}
+    valid_slugs: ClassVar[frozenset[str]] = frozenset({"data"})
+
+    @classmethod
+    def trusted(cls, **kwargs: Any) -> Self:
+        """
+        Create metadata from values that are already known to be valid (e.g.
+        literals in a population script) without running validation. Anything
+        derived from user input or files should use the regular constructor.
+        """
+        return cls.model_construct(**kwargs)
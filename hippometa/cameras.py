@@ -18,29 +18,31 @@ class CameraMetadata(BaseMetadata):
     date: datetime
     "The date of the camera videos"
 
-    valid_slugs: ClassVar[set[str]] = {
-        "act_highbay",
-        "busbar",
-        "c1",
-        "c2",
-        "c2_front",
-        "c3",
-        "c3_front",
-        "c4",
-        "c4_front",
-        "c5",
-        "highbay_back",
-        "highbay_cargo",
-        "lat_g5",
-        "lat_highbay",
-        "lat_shutter",
-        "latr",
-        "mirror1_latr",
-        "mirror2_latr",
-        "pumphouse",
-        "pumphouse_inside",
-        "satp1",
-        "satp2",
-        "satp3",
-        "site_entrance",
-    }
+    valid_slugs: ClassVar[frozenset[str]] = frozenset(
+        {
+            "act_highbay",
+            "busbar",
+            "c1",
+            "c2",
+            "c2_front",
+            "c3",
+            "c3_front",
+            "c4",
+            "c4_front",
+            "c5",
+            "highbay_back",
+            "highbay_cargo",
+            "lat_g5",
+            "lat_highbay",
+            "lat_shutter",
+            "latr",
+            "mirror1_latr",
+            "mirror2_latr",
+            "pumphouse",
+            "pumphouse_inside",
+            "satp1",
+            "satp2",
+            "satp3",
+            "site_entrance",
+        }
+    )
@@ -2,8 +2,9 @@
 A map set.
 """
 
+from io import BytesIO
 from pathlib import Path
-from typing import ClassVar, Literal
+from typing import Any, ClassVar, Literal
 
 from hippometa.base import BaseMetadata
 
@@ -15,19 +16,21 @@ class MapSet(BaseMetadata):
     """
 
     metadata_type: Literal["mapset"] = "mapset"
-    valid_slugs: ClassVar[set[str]] = {
-        "map",  # A regular, source and sky, and whatever else, map
-        "source_only",  # A source-only map
-        "source_free",  # A source-free map
-        "ivar",  # Inverse-variance map
-        "xlink",  # Cross-linking map
-        "mask",  # Sky apodization mask
-        "hits",  # Hit map (pixels that were hit by detectors)
-        "weights",  # A weights map (?)
-        "time",  # A time map, showing when individual detectors were hit
-        "file_names",  # The file names of atomic maps or TODs used to create this map
-        "data",  # Generic
-    }
+    valid_slugs: ClassVar[frozenset[str]] = frozenset(
+        {
+            "map",  # A regular, source and sky, and whatever else, map
+            "source_only",  # A source-only map
+            "source_free",  # A source-free map
+            "ivar",  # Inverse-variance map
+            "xlink",  # Cross-linking map
+            "mask",  # Sky apodization mask
+            "hits",  # Hit map (pixels that were hit by detectors)
+            "weights",  # A weights map (?)
+            "time",  # A time map, showing when individual detectors were hit
+            "file_names",  # The file names of atomic maps or TODs used to create this map
+            "data",  # Generic
+        }
+    )
 
     pixelisation: Literal["equirectangular", "healpix", "cartesian"]
 
@@ -53,32 +56,77 @@ class MapSet(BaseMetadata):
     "Tags used to categorizet his map, including scan split strategies and so forth"
 
     @classmethod
-    def from_fits(cls, filename: Path) -> "MapSet":
+    def from_fits(cls, filename: Path | bytes, hdu: int | str = 0) -> "MapSet":
         """
-        Load a MapSet from a FITS file.
+        Load a MapSet from a FITS file. Only the header of the requested HDU
+        is read; the pixel data is never touched, and later HDUs are not
+        scanned. Uses the (optional) fitsio backend if it is installed, and
+        astropy otherwise. The contents of a FITS file that is already in
+        memory may be passed instead of a path, avoiding a round-trip through
+        a temporary file.
         """
+        metadata = _read_fits_header(filename=filename, hdu=hdu)
+
+        pixelisation = metadata.get("PIXELIS", "healpix").lower()
+        if pixelisation not in ["healpix", "equirectangular"]:
+            # Check if CAR in ctype
+            if "CTYPE1" in metadata and ("CAR" in metadata["CTYPE1"].upper()):
+                pixelisation = "equirectangular"
+            else:
+                raise ValueError(f"Invalid pixelisation: {pixelisation}")
+
+        return cls(
+            pixelisation=pixelisation,
+            telescope=metadata.get("TELESCOP"),
+            instrument=metadata.get("INSTRUME"),
+            release=metadata.get("RELEASE"),
+            season=metadata.get("SEASON"),
+            patch=metadata.get("PATCH"),
+            frequency=metadata.get("FREQ", "").replace("f", ""),
+            polarization_convention=metadata.get("POLCCONV", ""),
+            tags=metadata.get("ACTTAGS", "").split(",")
+            if metadata.get("ACTTAGS")
+            else None,
+        )
+
+
+def _read_fits_header(filename: Path | bytes, hdu: int | str = 0) -> dict[str, Any]:
+    """
+    Read a single header from a FITS file into a dictionary, without reading
+    any of the pixel data.
+    """
+    if isinstance(filename, (bytes, bytearray, memoryview)):
+        # fitsio can only open files on disk, so in-memory buffers always go
+        # through astropy. BytesIO shares a bytes object's memory as long as
+        # nothing writes to it; bytearray and memoryview contents are copied.
         from astropy.io import fits
 
-        with fits.open(filename) as hdul:
-            metadata = hdul[0].header
-            pixelisation = metadata.get("PIXELIS", "healpix").lower()
-            if pixelisation not in ["healpix", "equirectangular"]:
-                # Check if CAR in ctype
-                if "CTYPE1" in metadata and ("CAR" in metadata["CTYPE1"].upper()):
-                    pixelisation = "equirectangular"
-                else:
-                    raise ValueError(f"Invalid pixelisation: {pixelisation}")
-
-            return cls(
-                pixelisation=pixelisation,
-                telescope=metadata.get("TELESCOP"),
-                instrument=metadata.get("INSTRUME"),
-                release=metadata.get("RELEASE"),
-                season=metadata.get("SEASON"),
-                patch=metadata.get("PATCH"),
-                frequency=metadata.get("FREQ", "").replace("f", ""),
-                polarization_convention=metadata.get("POLCCONV", ""),
-                tags=metadata.get("ACTTAGS", "").split(",")
-                if metadata.get("ACTTAGS")
-                else None,
-            )
+        with fits.open(
+            BytesIO(filename),
+            memmap=False,
+            lazy_load_hdus=True,
+            do_not_scale_image_data=True,
+            ignore_blank=True,
+        ) as hdul:
+            return dict(hdul[hdu].header)
+
+    try:
+        import fitsio
+    except ImportError:
+        fitsio = None
+
+    if fitsio is not None:
+        with fitsio.FITS(str(filename)) as handle:
+            header = handle[hdu].read_header()
+            return {key: header[key] for key in header.keys()}
+
+    from astropy.io import fits
+
+    with fits.open(
+        filename,
+        memmap=True,
+        lazy_load_hdus=True,
+        do_not_scale_image_data=True,
+        ignore_blank=True,
+    ) as hdul:
+        return dict(hdul[hdu].header)
@@ -28,6 +28,7 @@ class CreateProductResponse(BaseModel):
 class CompleteProductRequest(BaseModel):
     headers: dict[str, list[dict[str, str]]]
     sizes: dict[str, list[int]]
+    confirm: bool = False
 
 
 class ReadProductResponse(BaseModel):
@@ -18,6 +18,19 @@ class CreateCollectionRequest(BaseModel):
     description: str
     readers: list[str] = []
     writers: list[str] = []
+    products: list[PydanticObjectId] = []
+    child_collections: list[PydanticObjectId] = []
+
+
+class CreateCollectionTreeRequest(CreateCollectionRequest):
+    """
+    Request model for one collection in a bulk creation request. Children
+    created in the same request are referenced by their position in the
+    request list and must come before their parents.
+    """
+
+    name: str
+    child_indices: list[int] = []
 
 
 class UpdateCollectionRequest(BaseModel):
@@ -19,7 +19,7 @@ from hipposerve.api.models.product import (
     UpdateProductRequest,
     UpdateProductResponse,
 )
-from hipposerve.database import ProductMetadata
+from hipposerve.database import Product, ProductMetadata
 from hipposerve.service import acl, product, storage, users
 from hipposerve.service.auth import AuthenticationError, requires
 
@@ -104,9 +104,11 @@ async def complete_product(
     id: PydanticObjectId,
     request: Request,
     model: CompleteProductRequest,
-) -> None:
+) -> bool:
     """
     Complete a product's upload. Must be called before the sources are available.
+    If requested, the sources are also confirmed, saving a separate call to
+    /confirm. Returns whether they were.
     """
     logger.info(
         "Complete product request for {} from {}", id, request.user.display_name
@@ -128,6 +130,9 @@ async def complete_product(
         sizes=model.sizes,
     )
 
+    if model.confirm and success:
+        success = await product.confirm(product=item, storage=request.app.storage)
+
     if not success:
         raise HTTPException(
             status_code=status.HTTP_424_FAILED_DEPENDENCY,
@@ -136,6 +141,8 @@ async def complete_product(
 
     logger.info("Successfully completed product {} (id: {})", item.name, item.id)
 
+    return model.confirm
+
 
 @product_router.get("/{id}")
 @requires(["hippo:admin", "hippo:read"])
@@ -262,6 +269,56 @@ async def read_files(id: PydanticObjectId, request: Request) -> ReadFilesRespons
     )
 
 
+@product_router.post("/files")
+@requires(["hippo:admin", "hippo:read"])
+async def read_files_many(
+    model: list[PydanticObjectId], request: Request
+) -> list[ReadFilesResponse]:
+    """
+    Read several products' files at once, including pre-signed URLs for
+    downloads, in the order requested. Each product is only included once.
+    """
+
+    logger.info(
+        "Read files request for {} products from {}",
+        len(model),
+        request.user.display_name,
+    )
+
+    try:
+        items = await asyncio.gather(
+            *[
+                product.read_by_id(
+                    id=id, groups=request.user.groups, scopes=request.auth.scopes
+                )
+                for id in dict.fromkeys(model)
+            ]
+        )
+    except product.ProductNotFound:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Product not found"
+        )
+
+    async def read_files(item: Product) -> ReadFilesResponse:
+        metadata, files = await asyncio.gather(
+            item.to_metadata(),
+            product.read_files(product=item, storage=request.app.storage),
+        )
+
+        return ReadFilesResponse(product=metadata, files=files)
+
+    # Pre-signing is done for all of the products concurrently, too.
+    responses = await asyncio.gather(*[read_files(item) for item in items])
+
+    logger.info(
+        "Read pre-signed URLs for {} products requested by {}",
+        len(responses),
+        request.user.display_name,
+    )
+
+    return responses
+
+
 @product_router.get("/{id}/{slug}")
 @requires(["hippo:admin", "hippo:read"])
 async def read_slug(request: Request, id: str, slug: str) -> RedirectResponse:
@@ -2,6 +2,7 @@
 API endpoints for relationships between products and collections.
 """
 
+from collections import defaultdict
 from difflib import Differ
 
 from beanie import PydanticObjectId
@@ -10,17 +11,155 @@ from loguru import logger
 
 from hipposerve.api.models.relationships import (
     CreateCollectionRequest,
+    CreateCollectionTreeRequest,
     ReadCollectionCollectionResponse,
     ReadCollectionProductResponse,
     ReadCollectionResponse,
     UpdateCollectionRequest,
 )
+from hipposerve.database import Collection, Product
 from hipposerve.service import acl, collection, product
-from hipposerve.service.auth import requires
+from hipposerve.service.auth import AuthenticationError, requires
 
 relationship_router = APIRouter(prefix="/relationships")
 
 
+def _collection_response(item: Collection) -> ReadCollectionResponse:
+    """
+    Convert a collection (with its links fetched) to its API response.
+    """
+
+    return ReadCollectionResponse(
+        id=item.id,
+        name=item.name,
+        description=item.description,
+        owner=item.owner,
+        readers=item.readers,
+        writers=item.writers,
+        products=[
+            ReadCollectionProductResponse(
+                id=x.id,
+                name=x.name,
+                version=x.version,
+                description=x.description,
+                owner=x.owner,
+                uploaded=x.uploaded,
+                metadata=x.metadata,
+            )
+            for x in item.products
+        ],
+        child_collections=[
+            ReadCollectionCollectionResponse(
+                id=x.id,
+                name=x.name,
+                description=x.description,
+                owner=x.owner,
+                readers=x.readers,
+                writers=x.writers,
+            )
+            for x in item.child_collections
+        ],
+        parent_collections=[
+            ReadCollectionCollectionResponse(
+                id=x.id,
+                name=x.name,
+                description=x.description,
+                owner=x.owner,
+                readers=x.readers,
+                writers=x.writers,
+            )
+            for x in item.parent_collections
+        ],
+    )
+
+
+def _check_writable(items: list[Product], request: Request):
+    """
+    Raise a 403 unless the user can write to every product in `items`, which
+    must be checked before anything is created on their behalf.
+    """
+    try:
+        for item in items:
+            acl.check_user_access(
+                user_groups=request.user.groups,
+                document_groups=item.writers,
+                scopes=request.auth.scopes,
+            )
+    except AuthenticationError:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User does not have write access to this product",
+        )
+
+
+async def _resolve_members(
+    product_ids: list[PydanticObjectId],
+    child_ids: list[PydanticObjectId],
+    request: Request,
+) -> tuple[dict[PydanticObjectId, Product], dict[PydanticObjectId, Collection]]:
+    """
+    Read the products and child collections that new collections will
+    contain, with one query each, before anything is created. Raises a 404
+    if any of them are missing and a 403 if any product is not writable.
+    """
+    try:
+        items = await product.read_many(
+            ids=product_ids, groups=request.user.groups, scopes=request.auth.scopes
+        )
+    except product.ProductNotFound:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Product not found."
+        )
+
+    _check_writable(items, request)
+
+    try:
+        children = await collection.read_many(
+            ids=child_ids, groups=request.user.groups, scopes=request.auth.scopes
+        )
+    except collection.CollectionNotFound:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Collection not found."
+        )
+
+    return {x.id: x for x in items}, {x.id: x for x in children}
+
+
+async def _insert_with_members(
+    collections: list[Collection],
+    members: list[list[PydanticObjectId]],
+    items: dict[PydanticObjectId, Product],
+    request: Request,
+):
+    """
+    Insert new collections (built with `collection.new`) and add the products
+    listed for each in `members` to them, with one write for the collections
+    and one for the products. MongoDB only supports transactions on replica
+    sets, so if adding the products fails the collections are removed again.
+    """
+    links = defaultdict(list)
+
+    for coll, product_ids in zip(collections, members):
+        for product_id in product_ids:
+            links[product_id].append(coll)
+
+    await collection.create_many(collections)
+
+    try:
+        await product.add_collections(
+            links=links,
+            products=list(items.values()),
+            access_groups=request.user.groups,
+            scopes=request.auth.scopes,
+        )
+    except Exception:
+        await product.unlink_collections(
+            products=list(items.values()), collections=collections
+        )
+        await collection.discard([x.id for x in collections])
+        raise
+
+
 @relationship_router.put("/collection/{name}")
 @requires(["hippo:admin", "hippo:write"])
 async def create_collection(
@@ -29,28 +168,107 @@ async def create_collection(
     request: Request,
 ) -> PydanticObjectId:
     """
-    Create a new collection with {name}.
+    Create a new collection with {name}. Any products and child collections
+    listed in the request are attached to the new collection as part of the
+    same call, saving a round-trip per member.
     """
 
     logger.info(
         "Request to create collection: {} from {}", name, request.user.display_name
     )
 
-    coll = await collection.create(
+    items, children = await _resolve_members(
+        product_ids=model.products, child_ids=model.child_collections, request=request
+    )
+
+    coll = collection.new(
         name=name,
         user=request.user.display_name,
         description=model.description,
         collection_readers=model.readers,
         collection_writers=model.writers,
+        child_collections=list(children.values()),
+    )
+
+    await _insert_with_members(
+        collections=[coll], members=[list(items)], items=items, request=request
     )
 
     logger.info(
-        "Collection {} ({}) created for {}", coll.id, name, request.user.display_name
+        "Collection {} ({}) created for {} with {} products and {} child collections",
+        coll.id,
+        name,
+        request.user.display_name,
+        len(items),
+        len(children),
     )
 
     return coll.id
 
 
+@relationship_router.put("/collections")
+@requires(["hippo:admin", "hippo:write"])
+async def create_collection_tree(
+    model: list[CreateCollectionTreeRequest],
+    request: Request,
+) -> list[PydanticObjectId]:
+    """
+    Create several collections, and the links between them, in one request.
+    The IDs of the new collections are returned in request order.
+    """
+
+    logger.info(
+        "Request to create {} collections from {}",
+        len(model),
+        request.user.display_name,
+    )
+
+    for index, node in enumerate(model):
+        if not all(0 <= child < index for child in node.child_indices):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Child collections must be listed before their parents.",
+            )
+
+    items, children = await _resolve_members(
+        product_ids=[x for node in model for x in node.products],
+        child_ids=[x for node in model for x in node.child_collections],
+        request=request,
+    )
+
+    # IDs are assigned as the collections are built, so the whole tree can be
+    # linked up and then inserted at once.
+    created = []
+
+    for node in model:
+        created.append(
+            collection.new(
+                name=node.name,
+                user=request.user.display_name,
+                description=node.description,
+                collection_readers=node.readers,
+                collection_writers=node.writers,
+                child_collections=[children[x] for x in node.child_collections]
+                + [created[x] for x in node.child_indices],
+            )
+        )
+
+    await _insert_with_members(
+        collections=created,
+        members=[node.products for node in model],
+        items=items,
+        request=request,
+    )
+
+    logger.info(
+        "Created collections {} for {}",
+        [x.id for x in created],
+        request.user.display_name,
+    )
+
+    return [x.id for x in created]
+
+
 @relationship_router.get("/collection/{id}")
 @requires(["hippo:admin", "hippo:read"])
 async def read_collection(
@@ -72,48 +290,7 @@ async def read_collection(
             status_code=status.HTTP_404_NOT_FOUND, detail="Collection not found."
         )
 
-    return ReadCollectionResponse(
-        id=item.id,
-        name=item.name,
-        description=item.description,
-        owner=item.owner,
-        readers=item.readers,
-        writers=item.writers,
-        products=[
-            ReadCollectionProductResponse(
-                id=x.id,
-                name=x.name,
-                version=x.version,
-                description=x.description,
-                owner=x.owner,
-                uploaded=x.uploaded,
-                metadata=x.metadata,
-            )
-            for x in item.products
-        ],
-        child_collections=[
-            ReadCollectionCollectionResponse(
-                id=x.id,
-                name=x.name,
-                description=x.description,
-                owner=x.owner,
-                readers=x.readers,
-                writers=x.writers,
-            )
-            for x in item.child_collections
-        ],
-        parent_collections=[
-            ReadCollectionCollectionResponse(
-                id=x.id,
-                name=x.name,
-                description=x.description,
-                owner=x.owner,
-                readers=x.readers,
-                writers=x.writers,
-            )
-            for x in item.parent_collections
-        ],
-    )
+    return _collection_response(item)
 
 
 @relationship_router.get("/collection/search/{name}")
@@ -157,6 +334,35 @@ async def search_collection(
     ]
 
 
+@relationship_router.get("/collection/{id}/tree")
+@requires(["hippo:admin", "hippo:read"])
+async def read_collection_tree(
+    id: PydanticObjectId,
+    request: Request,
+    depth: int | None = None,
+) -> list[ReadCollectionResponse]:
+    """
+    Read a collection's details along with those of all of its descendants
+    (or those up to `depth` levels below it), root first. Each collection is
+    only included once.
+    """
+
+    logger.info(
+        "Request to read collection tree: {} from {}", id, request.user.display_name
+    )
+
+    try:
+        items = await collection.read_tree(
+            id=id, groups=request.user.groups, scopes=request.auth.scopes, depth=depth
+        )
+    except collection.CollectionNotFound:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Collection not found."
+        )
+
+    return [_collection_response(x) for x in items]
+
+
 @relationship_router.put("/collection/{collection_id}/{product_id}")
 @requires(["hippo:admin", "hippo:write"])
 async def add_product_to_collection(
@@ -201,6 +407,56 @@ async def add_product_to_collection(
         )
 
 
+@relationship_router.post("/collection/{collection_id}/products")
+@requires(["hippo:admin", "hippo:write"])
+async def add_products_to_collection(
+    collection_id: PydanticObjectId,
+    model: list[PydanticObjectId],
+    request: Request,
+) -> None:
+    """
+    Add several products to a collection at once.
+    """
+
+    logger.info(
+        "Request to add {} products to collection {} from {}",
+        len(model),
+        collection_id,
+        request.user.display_name,
+    )
+
+    try:
+        coll = await collection.read(
+            id=collection_id, groups=request.user.groups, scopes=request.auth.scopes
+        )
+    except collection.CollectionNotFound:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Collection not found."
+        )
+
+    try:
+        items = await product.read_many(
+            ids=model, groups=request.user.groups, scopes=request.auth.scopes
+        )
+    except product.ProductNotFound:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Product not found."
+        )
+
+    # Check every product before linking any, so that one unwritable product
+    # does not leave the others added.
+    _check_writable(items, request)
+
+    await product.add_collections(
+        links={x.id: [coll] for x in items},
+        products=items,
+        access_groups=request.user.groups,
+        scopes=request.auth.scopes,
+    )
+
+    logger.info("Successfully added {} products to {}", len(items), coll.name)
+
+
 @relationship_router.delete("/collection/{collection_id}/{product_id}")
 @requires(["hippo:admin", "hippo:write"])
 async def remove_product_from_collection(
@@ -535,6 +791,38 @@ async def add_child_collection(
         )
 
 
+@relationship_router.post("/collection/{parent_id}/children")
+@requires(["hippo:admin", "hippo:write"])
+async def add_child_collections(
+    parent_id: PydanticObjectId,
+    model: list[PydanticObjectId],
+    request: Request,
+) -> None:
+    """
+    Add several child collections to a parent collection at once.
+    """
+
+    logger.info(
+        "Request to add collections {} as children of {} from {}",
+        model,
+        parent_id,
+        request.user.display_name,
+    )
+
+    try:
+        await collection.add_children(
+            parent_id=parent_id,
+            child_ids=list(dict.fromkeys(model)),
+            groups=request.user.groups,
+            scopes=request.auth.scopes,
+        )
+        logger.info("Successfully added {} as children of {}", model, parent_id)
+    except collection.CollectionNotFound:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Collection not found."
+        )
+
+
 @relationship_router.delete("/collection/{child_id}/child_of/{parent_id}")
 @requires(["hippo:admin", "hippo:write"])
 async def remove_child_collection(
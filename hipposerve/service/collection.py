@@ -8,7 +8,7 @@ the product service.
 import re
 
 from beanie import PydanticObjectId
-from beanie.operators import Text
+from beanie.operators import In, Text
 from fastapi import HTTPException
 
 from hipposerve.database import Collection
@@ -24,19 +24,44 @@ class CollectionNotFound(Exception):
     pass
 
 
-async def create(
+def new(
     name: str,
     user: str,
     description: str,
     collection_readers: list[str] | None = None,
     collection_writers: list[str] | None = None,
-):
-    collection = Collection(
+    child_collections: list[Collection] | None = None,
+) -> Collection:
+    """
+    Build a collection without inserting it. Its ID is assigned straight away
+    so that other new collections can link to it before either is inserted.
+    """
+    return Collection(
+        id=PydanticObjectId(),
         name=name,
         owner=user,
         description=description,
         readers=set(collection_readers or []) | {user},
         writers=set(collection_writers or []) | {user},
+        child_collections=child_collections or [],
+    )
+
+
+async def create(
+    name: str,
+    user: str,
+    description: str,
+    collection_readers: list[str] | None = None,
+    collection_writers: list[str] | None = None,
+    child_collections: list[Collection] | None = None,
+):
+    collection = new(
+        name=name,
+        user=user,
+        description=description,
+        collection_readers=collection_readers,
+        collection_writers=collection_writers,
+        child_collections=child_collections,
     )
 
     await collection.insert()
@@ -44,6 +69,28 @@ async def create(
     return collection
 
 
+async def create_many(collections: list[Collection]) -> list[Collection]:
+    """
+    Insert several collections built with `new` in a single request. If the
+    insert fails part-way, any collections that were written are removed.
+    """
+    try:
+        await Collection.insert_many(collections)
+    except Exception:
+        await discard([x.id for x in collections])
+        raise
+
+    return collections
+
+
+async def discard(ids: list[PydanticObjectId]):
+    """
+    Remove collections that were created by the current request, to roll it
+    back. There are no access checks, so this must not be given other IDs.
+    """
+    await Collection.find(In(Collection.id, ids)).delete()
+
+
 async def read(id: PydanticObjectId, groups: list[str], scopes: set[str]):
     collection = await Collection.find_one(Collection.id == id, **LINK_POLICY)
 
@@ -58,6 +105,86 @@ async def read(id: PydanticObjectId, groups: list[str], scopes: set[str]):
     return collection
 
 
+async def read_many(
+    ids: list[PydanticObjectId], groups: list[str], scopes: set[str]
+) -> list[Collection]:
+    """
+    Read several collections, without following their links, in one query.
+    They are returned in the order of (the first appearance of) their IDs.
+    """
+    ids = list(dict.fromkeys(ids))
+
+    if not ids:
+        return []
+
+    found = {x.id: x for x in await Collection.find(In(Collection.id, ids)).to_list()}
+
+    if len(found) != len(ids):
+        raise CollectionNotFound
+
+    for item in found.values():
+        assert check_user_access(groups, item.readers + item.writers, scopes=scopes)
+
+    return [found[x] for x in ids]
+
+
+async def read_tree(
+    id: PydanticObjectId,
+    groups: list[str],
+    scopes: set[str],
+    depth: int | None = None,
+) -> list[Collection]:
+    """
+    Read a collection and its descendants, level by level with one query per
+    level, down to `depth` levels below it (or all of them if depth is None).
+    Collections that appear in several places are only returned once, and
+    descendants the user cannot access are left out, along with anything
+    only reachable through them.
+    """
+
+    root = await read(id=id, groups=groups, scopes=scopes)
+
+    tree = [root]
+    seen = {root.id}
+    level = [root]
+    levels = 0
+
+    while level and (depth is None or levels < depth):
+        child_ids = []
+
+        for parent in level:
+            for child in parent.child_collections:
+                if child.id not in seen:
+                    seen.add(child.id)
+                    child_ids.append(child.id)
+
+        if not child_ids:
+            break
+
+        if "hippo:admin" in scopes:
+            access_query = {"_id": {"$in": child_ids}}
+        else:
+            access_query = {
+                "$and": [
+                    {"_id": {"$in": child_ids}},
+                    {
+                        "$or": [
+                            {"readers": {"$in": groups}},
+                            {"writers": {"$in": groups}},
+                        ]
+                    },
+                ]
+            }
+
+        children = await Collection.find(access_query, **LINK_POLICY).to_list()
+
+        level = await collection_product_filter(groups, scopes, children)
+        tree.extend(level)
+        levels += 1
+
+    return tree
+
+
 async def read_most_recent(
     groups: list[str],
     scopes: set[str],
@@ -215,6 +342,21 @@ async def add_child(
     return parent
 
 
+async def add_children(
+    parent_id: PydanticObjectId,
+    child_ids: list[PydanticObjectId],
+    groups: list[str],
+    scopes: set[str],
+) -> Collection:
+    parent = await read(id=parent_id, groups=groups, scopes=scopes)
+    children = [await read(id=x, groups=groups, scopes=scopes) for x in child_ids]
+    assert check_user_access(groups, parent.writers, scopes=scopes)
+    parent.child_collections.extend(children)
+    await parent.save()
+
+    return parent
+
+
 async def remove_child(
     parent_id: PydanticObjectId,
     child_id: PydanticObjectId,
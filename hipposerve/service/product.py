@@ -6,8 +6,8 @@ import datetime
 import re
 from typing import Any, Literal
 
-from beanie import Link, PydanticObjectId, WriteRules
-from beanie.operators import Text
+from beanie import BulkWriter, Link, PydanticObjectId, WriteRules
+from beanie.operators import In, Text
 from bson.errors import InvalidId
 from loguru import logger
 from pydantic import BaseModel
@@ -219,6 +219,33 @@ async def read_by_id(
     return potential
 
 
+async def read_many(
+    ids: list[PydanticObjectId], groups: list[str], scopes: set[str]
+) -> list[Product]:
+    """
+    Read several products, without following their links, in one query.
+    They are returned in the order of (the first appearance of) their IDs.
+    """
+    ids = list(dict.fromkeys(ids))
+
+    if not ids:
+        return []
+
+    found = {x.id: x for x in await Product.find(In(Product.id, ids)).to_list()}
+
+    if len(found) != len(ids):
+        raise ProductNotFound
+
+    for item in found.values():
+        assert check_user_access(
+            user_groups=groups,
+            document_groups=item.readers + item.writers,
+            scopes=scopes,
+        )
+
+    return [found[x] for x in ids]
+
+
 async def search_by_name(
     name: str, groups: list[str], scopes: set[str], fetch_links: bool = True
 ) -> list[Product]:
@@ -893,6 +920,51 @@ async def add_collection(
     return
 
 
+async def add_collections(
+    links: dict[PydanticObjectId, list[Collection]],
+    products: list[Product],
+    access_groups: list[str],
+    scopes: set[str],
+):
+    """
+    Add each product to the collections listed for it in `links` (keyed by
+    product ID), with one update per product sent in a single request.
+    Nothing is written unless the user can write to every product.
+    """
+    for item in products:
+        assert check_user_access(
+            user_groups=access_groups, document_groups=item.writers, scopes=scopes
+        )
+
+    async with BulkWriter(object_class=Product) as bulk_writer:
+        for item in products:
+            if links.get(item.id):
+                await Product.find_one(Product.id == item.id).update(
+                    {
+                        "$addToSet": {
+                            "collections": {
+                                "$each": [x.to_ref() for x in links[item.id]]
+                            }
+                        }
+                    },
+                    bulk_writer=bulk_writer,
+                )
+
+    return
+
+
+async def unlink_collections(products: list[Product], collections: list[Collection]):
+    """
+    Remove the links from products to collections that were created by the
+    current request, to roll it back.
+    """
+    await Product.find(In(Product.id, [x.id for x in products])).update(
+        {"$pull": {"collections": {"$in": [x.to_ref() for x in collections]}}}
+    )
+
+    return
+
+
 async def remove_collection(
     product: Product, access_groups: list[str], scopes: set[str], collection: Collection
 ):
@@ -66,6 +66,7 @@ def test_api_product(test_api_client: TestClient, test_api_user: str):
     )
 
     response.raise_for_status()
+    assert response.json() is False
 
     # And check...
     response = test_api_client.post(f"/product/{product_id}/confirm")
@@ -80,6 +81,49 @@ def test_api_product(test_api_client: TestClient, test_api_user: str):
     assert response.status_code == 200
 
 
+def test_complete_and_confirm_product(test_api_client: TestClient, test_api_user: str):
+    source = PreUploadFile(name="confirm_file", size=9, checksum="test_checksum")
+
+    response = test_api_client.put(
+        "/product/new",
+        json={
+            "name": "test_complete_and_confirm",
+            "description": "test_description",
+            "metadata": {"metadata_type": "simple"},
+            "sources": {"data": source.model_dump()},
+            "product_readers": [test_api_user],
+            "product_writers": [test_api_user],
+        },
+    )
+
+    assert response.status_code == 200
+    validated = CreateProductResponse.model_validate(response.json())
+
+    response = requests.put(
+        validated.upload_urls[source.name][0],
+        data=b"test_data",
+        allow_redirects=True,
+    )
+    assert response.status_code == 200
+
+    # Confirming as part of completing the upload saves a call to /confirm
+    response = test_api_client.post(
+        f"/product/{validated.id}/complete",
+        json={
+            "headers": {source.name: [dict(response.headers)]},
+            "sizes": {source.name: [source.size]},
+            "confirm": True,
+        },
+    )
+    assert response.status_code == 200
+    assert response.json() is True
+
+    response = test_api_client.delete(
+        f"/product/{validated.id}/tree", params={"data": True}
+    )
+    assert response.status_code == 200
+
+
 def test_upload_product_again(
     test_api_client: TestClient, test_api_product: tuple[str, str]
 ):
@@ -121,6 +165,29 @@ def test_read_product(
         assert response.content == b"test_data"
 
 
+def test_read_many_products_files(
+    test_api_client: TestClient,
+    test_api_product: tuple[str, str],
+    test_api_user: str,
+):
+    response = test_api_client.post(
+        "/product/files", json=[test_api_product[1], test_api_product[1]]
+    )
+
+    assert response.status_code == 200
+    validated = [ReadFilesResponse.model_validate(x) for x in response.json()]
+
+    assert len(validated) == 1
+    assert validated[0].product.id == test_api_product[1]
+    assert all(x.url is not None for x in validated[0].files.values())
+
+    response = test_api_client.post(
+        "/product/files", json=[test_api_product[1], "7" * 24]
+    )
+
+    assert response.status_code == 404
+
+
 def test_read_product_tree(
     test_api_client: TestClient,
     test_api_product: tuple[str, str],
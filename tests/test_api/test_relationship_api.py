@@ -3,8 +3,13 @@ Tests for the relationship API endpoints, creating, adding to, and deleting coll
 parent/child relationships, and side-by-side relationships.
 """
 
+from types import SimpleNamespace
+
+import pytest
 import pytest_asyncio
+from fastapi import HTTPException, Request
 from fastapi.testclient import TestClient
+from starlette.authentication import AuthCredentials
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -243,3 +248,245 @@ def test_add_child_relationship_for_collection(test_api_client):
 
     response = test_api_client.delete(f"/relationships/collection/{collection_c}")
     assert response.status_code == 200
+
+
+def test_create_collection_with_members(test_api_client, test_api_products_for_use):
+    collection_name, collection_id, product_names, product_ids = (
+        test_api_products_for_use
+    )
+
+    response = test_api_client.put(
+        "/relationships/collection/Collection_With_Members",
+        json={
+            "description": "test_description",
+            "products": product_ids[:2],
+            "child_collections": [collection_id],
+        },
+    )
+    assert response.status_code == 200
+    new_collection_id = response.json()
+
+    response = test_api_client.get(f"/relationships/collection/{new_collection_id}")
+    assert response.status_code == 200
+    assert {x["id"] for x in response.json()["products"]} == set(product_ids[:2])
+    assert response.json()["child_collections"][0]["id"] == collection_id
+
+    # Missing members must not leave a partially created collection behind
+    response = test_api_client.put(
+        "/relationships/collection/Collection_With_Missing_Members",
+        json={"description": "test_description", "products": ["7" * 24]},
+    )
+    assert response.status_code == 404
+
+    response = test_api_client.delete(f"/relationships/collection/{new_collection_id}")
+    assert response.status_code == 200
+
+
+def test_create_collection_tree(test_api_client, test_api_products_for_use):
+    collection_name, collection_id, product_names, product_ids = (
+        test_api_products_for_use
+    )
+
+    # Two children, then a parent that holds both and an existing collection
+    response = test_api_client.put(
+        "/relationships/collections",
+        json=[
+            {"name": "Child_A", "description": "test_description"},
+            {
+                "name": "Child_B",
+                "description": "test_description",
+                "products": product_ids[:1],
+            },
+            {
+                "name": "Parent",
+                "description": "test_description",
+                "products": product_ids[:1],
+                "child_collections": [collection_id],
+                "child_indices": [0, 1],
+            },
+        ],
+    )
+    assert response.status_code == 200
+    child_a, child_b, parent = response.json()
+
+    response = test_api_client.get(f"/relationships/collection/{parent}")
+    assert response.status_code == 200
+    assert {x["id"] for x in response.json()["child_collections"]} == {
+        child_a,
+        child_b,
+        collection_id,
+    }
+
+    response = test_api_client.get(f"/relationships/collection/{child_b}")
+    assert response.status_code == 200
+    assert response.json()["products"][0]["id"] == product_ids[0]
+    assert response.json()["parent_collections"][0]["id"] == parent
+
+    # A product shared by several new collections is added to all of them
+    response = test_api_client.get(f"/relationships/collection/{parent}")
+    assert response.json()["products"][0]["id"] == product_ids[0]
+
+    # A missing member means none of the collections are created
+    response = test_api_client.get("/relationships/collection/search/Orphan_Child")
+    assert response.status_code == 200
+    existing = len(response.json())
+
+    response = test_api_client.put(
+        "/relationships/collections",
+        json=[
+            {"name": "Orphan_Child", "description": "test_description"},
+            {
+                "name": "Orphan_Parent",
+                "description": "test_description",
+                "products": ["7" * 24],
+                "child_indices": [0],
+            },
+        ],
+    )
+    assert response.status_code == 404
+
+    response = test_api_client.get("/relationships/collection/search/Orphan_Child")
+    assert len(response.json()) == existing
+
+    # Parents may only reference collections listed before them
+    response = test_api_client.put(
+        "/relationships/collections",
+        json=[
+            {"name": "Parent", "description": "test_description", "child_indices": [1]},
+            {"name": "Child", "description": "test_description"},
+        ],
+    )
+    assert response.status_code == 422
+
+    for id in [parent, child_a, child_b]:
+        response = test_api_client.delete(f"/relationships/collection/{id}")
+        assert response.status_code == 200
+
+
+def test_read_collection_tree(test_api_client, test_api_products_for_use):
+    collection_name, collection_id, product_names, product_ids = (
+        test_api_products_for_use
+    )
+
+    # A grandchild shared by both children, so it must only come back once
+    response = test_api_client.put(
+        "/relationships/collections",
+        json=[
+            {
+                "name": "Grandchild",
+                "description": "test_description",
+                "products": product_ids[:1],
+            },
+            {
+                "name": "Child_A",
+                "description": "test_description",
+                "child_indices": [0],
+            },
+            {
+                "name": "Child_B",
+                "description": "test_description",
+                "child_indices": [0],
+            },
+            {
+                "name": "Parent",
+                "description": "test_description",
+                "child_indices": [1, 2],
+            },
+        ],
+    )
+    assert response.status_code == 200
+    grandchild, child_a, child_b, parent = response.json()
+
+    response = test_api_client.get(f"/relationships/collection/{parent}/tree")
+    assert response.status_code == 200
+    tree = response.json()
+    assert tree[0]["id"] == parent
+    assert sorted(x["id"] for x in tree) == sorted(
+        [parent, child_a, child_b, grandchild]
+    )
+    assert (
+        next(x for x in tree if x["id"] == grandchild)["products"][0]["id"]
+        == (product_ids[0])
+    )
+
+    response = test_api_client.get(
+        f"/relationships/collection/{parent}/tree", params={"depth": 1}
+    )
+    assert response.status_code == 200
+    assert {x["id"] for x in response.json()} == {parent, child_a, child_b}
+
+    response = test_api_client.get(
+        "/relationships/collection/000000000000000000000000/tree"
+    )
+    assert response.status_code == 404
+
+    for id in [parent, child_a, child_b, grandchild]:
+        response = test_api_client.delete(f"/relationships/collection/{id}")
+        assert response.status_code == 200
+
+
+def test_add_many_to_collection(test_api_client, test_api_products_for_use):
+    collection_name, collection_id, product_names, product_ids = (
+        test_api_products_for_use
+    )
+
+    parent = test_api_client.put(
+        "/relationships/collection/Batch_Parent",
+        json={"description": "test_description"},
+    ).json()
+
+    response = test_api_client.post(
+        f"/relationships/collection/{parent}/products", json=product_ids
+    )
+    assert response.status_code == 200
+
+    response = test_api_client.post(
+        f"/relationships/collection/{parent}/children", json=[collection_id]
+    )
+    assert response.status_code == 200
+
+    response = test_api_client.get(f"/relationships/collection/{parent}")
+    assert response.status_code == 200
+    assert {x["id"] for x in response.json()["products"]} == set(product_ids)
+    assert response.json()["child_collections"][0]["id"] == collection_id
+
+    response = test_api_client.post(
+        f"/relationships/collection/{parent}/products", json=["7" * 24]
+    )
+    assert response.status_code == 404
+
+    response = test_api_client.post(
+        f"/relationships/collection/{parent}/children", json=["7" * 24]
+    )
+    assert response.status_code == 404
+
+    response = test_api_client.delete(f"/relationships/collection/{parent}")
+    assert response.status_code == 200
+
+
+def test_add_many_to_collection_unwritable():
+    # Imported here as the app's settings are only configured by the fixtures.
+    from hipposerve.api.relationships import _check_writable
+
+    request = Request(
+        {
+            "type": "http",
+            "user": SimpleNamespace(groups=["test_user"]),
+            "auth": AuthCredentials(["hippo:write"]),
+        }
+    )
+
+    # Every product is checked before any are linked, so one unwritable
+    # product stops the whole request.
+    with pytest.raises(HTTPException) as e:
+        _check_writable(
+            [
+                SimpleNamespace(writers=["test_user"]),
+                SimpleNamespace(writers=["someone_else"]),
+            ],
+            request,
+        )
+
+    assert e.value.status_code == 403
+
+    _check_writable([SimpleNamespace(writers=["test_user"])], request)
@@ -6,6 +6,8 @@ from pathlib import Path
 
 import pytest
 
+from hippoclient.caching import MultiCache, clear_all
+
 
 def test_add_file_to_cache(cache):
     """
@@ -57,3 +59,73 @@ def test_add_real_file_to_cache(cache):
 def test_unavailable(cache):
     with pytest.raises(FileNotFoundError):
         cache.available("not-a-real-id")
+
+
+def test_metadata_cache(cache):
+    assert cache.get_metadata("collection:abc", max_age=60) is None
+
+    cache.set_metadata("collection:abc", '{"name": "old"}')
+    cache.set_metadata("collection:abc", '{"name": "new"}')
+
+    assert cache.get_metadata("collection:abc", max_age=60) == '{"name": "new"}'
+    assert cache.get_metadata("collection:abc", max_age=0) is None
+
+    cache.clear_metadata()
+
+    assert cache.get_metadata("collection:abc", max_age=60) is None
+
+
+def test_clear_metadata_prefix(cache):
+    multi = MultiCache(caches=[cache])
+
+    multi.set_metadata("collection:abc", '{"name": "collection"}')
+    multi.set_metadata("product-sources:abc", "[]")
+
+    generation = multi.metadata_generation
+
+    multi.clear_metadata(prefix="collection:")
+
+    assert multi.get_metadata("collection:abc", max_age=60) is None
+    assert multi.get_metadata("product-sources:abc", max_age=60) == "[]"
+
+    # Responses read before a clear are not stored after it.
+    multi.set_metadata("collection:abc", '{"name": "stale"}', generation=generation)
+
+    assert multi.get_metadata("collection:abc", max_age=60) is None
+
+    multi.clear_metadata()
+
+    assert multi.get_metadata("product-sources:abc", max_age=60) is None
+
+
+def test_available_many(cache):
+    multi = MultiCache(caches=[cache])
+
+    for id in ["available", "pending"]:
+        cache._add(id=id, path=f"{id}.txt", checksum="not-a-checksum", size=1)
+
+    cache._mark_available("available")
+
+    assert multi.available_many(["available", "pending", "not-a-real-id"]) == {
+        "available": cache.path / "available.txt"
+    }
+
+    cache._mark_unavailable("available")
+
+
+def test_clear_all(cache):
+    multi = MultiCache(caches=[cache])
+
+    (cache.path / "present.txt").write_text("data")
+
+    for id in ["present", "pending"]:
+        cache._add(id=id, path=f"{id}.txt", checksum="not-a-checksum", size=4)
+
+    cache._mark_available("present")
+
+    assert multi.writeable_caches == [cache]
+
+    clear_all(cache)
+
+    assert cache.complete_id_list == []
+    assert not (cache.path / "present.txt").exists()
@@ -2,9 +2,12 @@
 Tests for collection uploads.
 """
 
-from pytest import fixture
+from pytest import fixture, raises
 
 from henry import Henry
+from henry.collection import LocalCollection, RemoteCollection
+from henry.exceptions import PreflightFailedError
+from henry.product import LocalProduct, RemoteProduct
 from hippoclient.collections import delete as delete_collection
 from hippoclient.product import delete as delete_product
 from hippometa import SimpleMetadata
@@ -51,3 +54,153 @@ def test_add_product_to_existing_collection(collection_id, client: Henry):
     assert re_read_coll.products[0].product_id == product_id
 
     delete_product(client=client.client, id=product_id)
+
+
+def test_freeze_collection_tree():
+    shared = LocalCollection(name="Shared", description="Shared child")
+    children = [
+        LocalCollection(name=f"Child {x}", description="Child", collections=[shared])
+        for x in range(3)
+    ]
+    parent = LocalCollection(name="Parent", description="Parent", collections=children)
+
+    nodes, edges = parent.freeze()
+
+    assert nodes == (shared, *children, parent)
+    assert sorted(edges) == [(1, 0), (2, 0), (3, 0), (4, 1), (4, 2), (4, 3)]
+
+
+def test_push_collection_tree(client: Henry):
+    grandchild = client.new_collection(name="Grandchild", description="Grandchild")
+    child = client.new_collection(
+        name="Child", description="Child", collections=[grandchild]
+    )
+    parent = client.new_collection(
+        name="Parent", description="Parent", collections=[child]
+    )
+
+    client.push(parent)
+
+    coll = client.pull_collection(
+        parent.collection_id, realize_sources=False, pull_children=True
+    )
+
+    assert coll.collections[0].collection_id == child.collection_id
+    assert coll.collections[0].collections[0].collection_id == (
+        grandchild.collection_id
+    )
+
+    for item in [parent, child, grandchild]:
+        delete_collection(id=item.collection_id, client=client.client)
+
+
+def test_collection_contains():
+    product = LocalProduct(
+        name="Test Product", description="Test product", metadata=SimpleMetadata()
+    )
+    child = LocalCollection(name="Child", description="Child")
+    parent = LocalCollection(name="Parent", description="Parent", products=[product])
+
+    assert product in parent
+    assert child not in parent
+
+    parent.append(child)
+
+    assert child in parent
+
+
+def test_collection_extend():
+    product = LocalProduct(
+        name="Test Product", description="Test product", metadata=SimpleMetadata()
+    )
+    child = LocalCollection(name="Child", description="Child")
+    parent = LocalCollection(name="Parent", description="Parent")
+
+    parent.extend([child, product])
+
+    assert parent.products == [product]
+    assert parent.collections == [child]
+
+    # Nothing is added if any of the new members is invalid
+    with raises(TypeError):
+        parent.extend([product, "not a product"])
+
+    assert len(parent) == 2
+
+
+def test_remote_collection_direct_mutation():
+    remote = RemoteCollection(
+        collection_id="1" * 24,
+        name="Remote",
+        description="Remote collection",
+        owner="test_user",
+        original_name="Remote",
+        original_description="Remote collection",
+    )
+
+    assert not remote._has_new_members()
+
+    # Members added straight to the lists are pushed too, and preflighted.
+    product = LocalProduct(
+        name="X", description="Test product", metadata=SimpleMetadata()
+    )
+    remote.products.append(product)
+
+    assert remote._has_new_members()
+
+    with raises(PreflightFailedError):
+        remote.preflight()
+
+
+def test_remote_collection_lazy_children():
+    product = RemoteProduct(
+        product_id="2" * 24,
+        name="Product",
+        description="Test product",
+        metadata=SimpleMetadata(),
+        sources={},
+    )
+    child = RemoteCollection(
+        collection_id="3" * 24,
+        name="Child",
+        description="Child collection",
+        owner="test_user",
+        original_name="Child",
+        original_description="Child collection",
+    )
+    parent = RemoteCollection(
+        collection_id="1" * 24,
+        name="Parent",
+        description="Parent collection",
+        owner="test_user",
+        original_name="Parent",
+        original_description="Parent collection",
+        original_product_ids={product.product_id},
+        original_collection_ids={child.collection_id},
+    )
+
+    # As left by a pull with pull_children=False; members that were already
+    # pulled elsewhere in the tree are re-used, so no requests are made.
+    parent._deferred = {
+        "client": None,
+        "cache": None,
+        "console": None,
+        "realize_sources": False,
+        "max_age": 0,
+        "pulled": {
+            f"product:{product.product_id}": product,
+            f"collection:{child.collection_id}": child,
+        },
+        "product_ids": [product.product_id],
+        "collection_ids": [child.collection_id],
+    }
+
+    assert parent.products == [] and parent.collections == []
+    assert "1 products and 1 child collections" in str(parent)
+    assert "<1 products, 1 collections not yet pulled>" in repr(parent)
+
+    assert len(parent) == 2
+    assert parent.products == [product]
+    assert parent.collections == [child]
+    assert "not yet pulled" not in repr(parent)
+    assert not parent._has_new_members()
@@ -5,7 +5,8 @@ Tests for the collection service.
 import pytest
 from beanie import PydanticObjectId
 
-from hipposerve.service import acl, collection
+from hipposerve.service import acl, collection, product
+from hipposerve.service.auth import AuthenticationError
 
 
 @pytest.mark.asyncio(loop_scope="session")
@@ -130,3 +131,26 @@ async def test_child_relationship(created_user):
 
     assert child.id not in (x.id for x in parent.child_collections)
     assert parent.id not in (x.id for x in child.parent_collections)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_add_collections_unwritable(
+    created_collection, created_full_product, created_user
+):
+    before = await collection.read(
+        id=created_collection.id, groups=created_user.groups, scopes=set()
+    )
+
+    with pytest.raises(AuthenticationError):
+        await product.add_collections(
+            links={created_full_product.id: [created_collection]},
+            products=[created_full_product],
+            access_groups=["not_a_writer"],
+            scopes=set(),
+        )
+
+    after = await collection.read(
+        id=created_collection.id, groups=created_user.groups, scopes=set()
+    )
+
+    assert {x.id for x in after.products} == {x.id for x in before.products}